@@ -1,16 +1,26 @@
+from __future__ import annotations
+
 import click
-from src.modules.session.session_store import SessionStore
+from typing import TYPE_CHECKING
 from src.modules.session.commands import create_session_commands
 from src.modules.playbook.commands import create_playbook_commands
 from src.modules.request.commands import create_request_commands
 from src.modules.logging import create_logger, BaseLogger
 
+if TYPE_CHECKING:
+    from src.modules.session.session_store import SessionStore
+
 
 class RestbookContext:
     """Context object to store CLI state."""
     def __init__(self):
         self.logger = None
-        self.session_store = SessionStore()
+
+    @property
+    def session_store(self) -> SessionStore:
+        """Get the shared session store, loading it on first access."""
+        from src.modules.session.session_store import get_default_session_store
+        return get_default_session_store()
 
 pass_context = click.make_pass_decorator(RestbookContext, ensure=True)
 
@@ -1,4 +1,8 @@
+import io
+import sys
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Iterator, Optional
 from loguru import logger
 
 
@@ -8,6 +12,37 @@ class BaseLogger(ABC):
     def __init__(self, log_level: str = "INFO"):
         self.logger = logger
         self.log_level = log_level
+        # Collects formatted records while a buffered() block is open
+        self._buffer: Optional[io.StringIO] = None
+    
+    def _write(self, message: str) -> None:
+        """Loguru sink that writes to stdout, or to the buffer while buffering."""
+        if self._buffer is not None:
+            self._buffer.write(message)
+            return
+        sys.stdout.write(message)
+        sys.stdout.flush()
+
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """
+        Collect the output logged inside the block and write it to stdout at once.
+        
+        Nested blocks join the outermost one. Buffered output is still written
+        if the block raises.
+        """
+        if self._buffer is not None:
+            yield
+            return
+            
+        self._buffer = io.StringIO()
+        try:
+            yield
+        finally:
+            output = self._buffer.getvalue()
+            self._buffer = None
+            if output:
+                self._write(output)
     
     @abstractmethod
     def log_step(self, step_number: int, method: str, endpoint: str):
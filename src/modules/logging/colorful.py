@@ -1,6 +1,5 @@
 import click
 from .base import BaseLogger
-import sys
 
 
 class ColorfulLogger(BaseLogger):
@@ -11,7 +10,7 @@ class ColorfulLogger(BaseLogger):
         # Configure loguru for colored output
         self.logger.configure(
             handlers=[{
-                "sink": sys.stdout,
+                "sink": self._write,
                 "colorize": True,
                 "format": "<cyan>{time:YYYY-MM-DD HH:mm:ss.SSS}</cyan> | "
                          "<level>{level: <8}</level> | "
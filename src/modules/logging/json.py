@@ -1,5 +1,4 @@
 import json
-import sys
 from .base import BaseLogger
 
 
@@ -11,7 +10,7 @@ class JsonLogger(BaseLogger):
         # Configure loguru for JSON output
         self.logger.configure(
             handlers=[{
-                "sink": sys.stdout,
+                "sink": self._write,
                 "serialize": True,  # JSON output
                 "format": "{time} | {level} | {message}",
                 "level": log_level
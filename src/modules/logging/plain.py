@@ -1,4 +1,3 @@
-import sys
 from .base import BaseLogger
 
 
@@ -10,7 +9,7 @@ class PlainLogger(BaseLogger):
         # Configure loguru for plain output
         self.logger.configure(
             handlers=[{
-                "sink": sys.stdout,
+                "sink": self._write,
                 "format": "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {message}",
                 "colorize": False,
                 "level": log_level
@@ -151,6 +151,15 @@ class ResilientHttpClient:
         )
 
         try:
+            # Let token requests reuse the same connection pool; this builds
+            # the session's authenticator, which rejects invalid credentials
+            try:
+                self.session.use_http_session(client)
+            except ValueError as err:
+                error_msg = f"Invalid authentication configuration: {str(err)}"
+                self._handle_error(error_msg)
+                raise AuthenticationError(error_msg)
+            
             for attempt in range(self.config.max_retries + 1):
                 response = None
                 try:
@@ -302,7 +311,8 @@ class ResilientHttpClient:
         request_headers = {}
         if not self.session.is_authenticated():
             await self.session.authenticate()
-        request_headers = self.session.get_headers()
+        # Copy so request headers never leak into the authenticator's cached headers
+        request_headers = dict(self.session.get_headers())
         if request_spec.headers:
             request_headers.update(request_spec.headers)
 
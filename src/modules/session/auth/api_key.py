@@ -13,6 +13,8 @@ class ApiKeyAuthenticator(Authenticator):
         self.api_key = credentials['api_key']
         # Get header name from credentials or use default
         self.header_name = credentials.get('header_name', 'X-API-Key')
+        # The header never changes for a static key, so build it once
+        self._headers = {self.header_name: self.api_key}
         # API keys are always authenticated once key is set
         self.is_authenticated = True
 
@@ -26,4 +28,4 @@ class ApiKeyAuthenticator(Authenticator):
 
     def get_headers(self) -> Dict[str, str]:
         super().get_headers()  # Check authentication state
-        return {self.header_name: self.api_key} 
\ No newline at end of file
+        return self._headers 
\ No newline at end of file
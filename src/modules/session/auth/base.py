@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Optional
+import aiohttp
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthConfig:
     """Configuration for authentication."""
     type: str
@@ -16,6 +17,8 @@ class Authenticator(ABC):
     def __init__(self, credentials: Dict[str, str]):
         self.credentials = credentials
         self.is_authenticated = False
+        # Optional HTTP session owned by the caller, shared with API requests
+        self.http_session: Optional[aiohttp.ClientSession] = None
 
     @abstractmethod
     async def authenticate(self) -> None:
@@ -35,6 +38,14 @@ class Authenticator(ABC):
         """
         pass
 
+    def is_token_valid(self) -> bool:
+        """Check whether the current credentials can be used without re-authenticating.
+        
+        Returns:
+            bool: True if authenticated and the token has not expired
+        """
+        return self.is_authenticated
+
     @abstractmethod
     def get_headers(self) -> Dict[str, str]:
         """Get headers for authenticated requests.
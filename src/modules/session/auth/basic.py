@@ -13,6 +13,8 @@ class BasicAuthenticator(Authenticator):
         self.username = credentials['username']
         self.password = credentials['password']
         self._auth_header = self._create_auth_header()
+        # The header never changes for static credentials, so build it once
+        self._headers = {'Authorization': self._auth_header}
         # Basic auth is always authenticated once credentials are set
         self.is_authenticated = True
 
@@ -32,4 +34,4 @@ class BasicAuthenticator(Authenticator):
 
     def get_headers(self) -> Dict[str, str]:
         super().get_headers()  # Check authentication state
-        return {'Authorization': self._auth_header} 
\ No newline at end of file
+        return self._headers
\ No newline at end of file
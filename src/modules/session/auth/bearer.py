@@ -10,6 +10,8 @@ class BearerAuthenticator(Authenticator):
         if 'token' not in credentials:
             raise ValueError("Bearer authentication requires 'token' in credentials")
         self.token = credentials['token']
+        # The header never changes for a static token, so build it once
+        self._headers = {'Authorization': f'Bearer {self.token}'}
         # Bearer tokens are always authenticated once token is set
         self.is_authenticated = True
 
@@ -23,4 +25,4 @@ class BearerAuthenticator(Authenticator):
 
     def get_headers(self) -> Dict[str, str]:
         super().get_headers()  # Check authentication state
-        return {'Authorization': f'Bearer {self.token}'} 
\ No newline at end of file
+        return self._headers 
\ No newline at end of file
@@ -1,4 +1,5 @@
-from typing import Dict, Type
+from typing import Dict, Optional, Type
+import aiohttp
 from .base import Authenticator, AuthConfig
 from .bearer import BearerAuthenticator
 from .basic import BasicAuthenticator
@@ -6,8 +7,17 @@ from .oauth2 import OAuth2Authenticator
 from .api_key import ApiKeyAuthenticator
 
 
-def create_authenticator(config: AuthConfig) -> Authenticator:
-    """Create an authenticator based on the auth type."""
+def create_authenticator(
+    config: AuthConfig,
+    http_session: Optional[aiohttp.ClientSession] = None
+) -> Authenticator:
+    """Create an authenticator based on the auth type.
+    
+    Args:
+        config: Authentication configuration
+        http_session: Optional HTTP session to reuse for auth requests.
+            Its lifecycle is owned by the caller.
+    """
     auth_types: Dict[str, Type[Authenticator]] = {
         'bearer': BearerAuthenticator,
         'basic': BasicAuthenticator,
@@ -18,4 +28,6 @@ def create_authenticator(config: AuthConfig) -> Authenticator:
     if config.type not in auth_types:
         raise ValueError(f"Unsupported authentication type: {config.type}")
     
-    return auth_types[config.type](config.credentials) 
\ No newline at end of file
+    authenticator = auth_types[config.type](config.credentials)
+    authenticator.http_session = http_session
+    return authenticator 
\ No newline at end of file
@@ -1,8 +1,24 @@
-from typing import Dict, Optional
+import hashlib
+import json
+import logging
+import time
+from typing import Callable, Dict, Optional, Set, Tuple
+from urllib.parse import urlencode
 import aiohttp
-import click
 from .base import Authenticator
 
+logger = logging.getLogger(__name__)
+
+# Grant types already warned about in this process
+_WARNED_GRANT_TYPES: Set[str] = set()
+
+# Tokens shared by authenticators with identical token requests, keyed by a hash
+# of the request and holding (access_token, refresh_token, expires_at)
+_TOKEN_CACHE: Dict[str, Tuple[str, Optional[str], float]] = {}
+_TOKEN_CACHE_MAX_SIZE = 64
+# Cached tokens this close to expiry are fetched again instead of reused
+_TOKEN_EXPIRY_MARGIN = 30.0
+
 
 class OAuth2Authenticator(Authenticator):
     """OAuth2 authentication."""
@@ -13,6 +29,12 @@ class OAuth2Authenticator(Authenticator):
         'password',           # Resource owner password flow
         'refresh_token'       # Refresh token flow
     }
+
+    # Grants whose token request carries per-user fields, never shared via the cache
+    _USER_SPECIFIC_GRANTS = frozenset({'authorization_code', 'refresh_token'})
+
+    # Token requests are sent as pre-encoded form bodies
+    FORM_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
     
     def __init__(self, credentials: Dict[str, str]):
         super().__init__(credentials)
@@ -33,118 +55,188 @@ class OAuth2Authenticator(Authenticator):
         self.access_token_key = credentials.get('access_token_key', 'access_token')
         self.refresh_token_key = credentials.get('refresh_token_key', 'refresh_token')
         self.grant_type = credentials.get('grant_type')
+
+        self.access_token: Optional[str] = None
+        self.refresh_token: Optional[str] = None
+        self._headers: Dict[str, str] = {}
+        # Monotonic deadline from the token's expires_in, if the server sent one
+        self._expires_at: Optional[float] = None
+
+        # Static form fields shared by every token request
+        self._base_data: Dict[str, str] = {
+            self.client_id_key: self.client_id,
+            self.client_secret_key: self.client_secret,
+        }
+        if self.grant_type:
+            self._base_data['grant_type'] = self.grant_type
+
+        # Static form fields for the initial token request
+        self._auth_data = self._base_data.copy()
         
         if self.grant_type:
-            click.echo(f"Warning: Grant type {self.grant_type} is not yet supported. this is a development feature.")
+            if self.grant_type not in _WARNED_GRANT_TYPES:
+                _WARNED_GRANT_TYPES.add(self.grant_type)
+                logger.warning("Grant type %s is not yet supported. this is a development feature.", self.grant_type)
             self._set_up_grant_type()
-            
-        self.access_token: Optional[str] = None
-        self.refresh_token: Optional[str] = None
+
+        if self.scope:
+            self._auth_data['scope'] = self.scope
+
+        # Pre-encoded form bodies, so only dynamic fields are encoded per request
+        self._auth_body = urlencode(self._auth_data)
+        self._base_body = urlencode(self._base_data)
+        # Only grants whose whole request is static can share tokens; a code or
+        # refresh token identifies a user and is not part of the static body
+        self._token_cache_key: Optional[str] = None
+        if self.grant_type not in self._USER_SPECIFIC_GRANTS:
+            self._token_cache_key = hashlib.sha256(f"{self.token_url}\0{self._auth_body}".encode()).hexdigest()
 
     def _set_up_grant_type(self):
-        match self.grant_type:
-            case 'password':
-                if 'username' not in self.credentials or 'password' not in self.credentials:
-                    raise ValueError("Password grant type requires 'username' and 'password'")
-                self.username = self.credentials['username']
-                self.password = self.credentials['password']
-            case 'authorization_code':
-                if 'redirect_uri' not in self.credentials:
-                    raise ValueError("Authorization code grant type requires 'redirect_uri'")
-                self.redirect_uri = self.credentials['redirect_uri']
-            case 'refresh_token':
-                if 'refresh_token' not in self.credentials:
-                    raise ValueError("Refresh token grant type requires 'refresh_token'")
-                self.refresh_token = self.credentials['refresh_token']
-            case _:
-                raise ValueError(f"Unsupported grant type: {self.grant_type}. "
-                                 f"Supported types are: {', '.join(self.SUPPORTED_GRANT_TYPES)}")
+        setup = self._GRANT_TYPE_SETUP.get(self.grant_type)
+        if setup is None:
+            raise ValueError(f"Unsupported grant type: {self.grant_type}. "
+                             f"Supported types are: {', '.join(self.SUPPORTED_GRANT_TYPES)}")
+        setup(self)
+
+    def _set_up_client_credentials_grant(self):
+        # Client credentials are already part of the base request data
+        pass
+
+    def _set_up_password_grant(self):
+        if 'username' not in self.credentials or 'password' not in self.credentials:
+            raise ValueError("Password grant type requires 'username' and 'password'")
+        self.username = self.credentials['username']
+        self.password = self.credentials['password']
+        self._auth_data['username'] = self.username
+        self._auth_data['password'] = self.password
+
+    def _set_up_authorization_code_grant(self):
+        if 'redirect_uri' not in self.credentials:
+            raise ValueError("Authorization code grant type requires 'redirect_uri'")
+        self.redirect_uri = self.credentials['redirect_uri']
+        self._auth_data['redirect_uri'] = self.redirect_uri
+
+    def _set_up_refresh_token_grant(self):
+        if 'refresh_token' not in self.credentials:
+            raise ValueError("Refresh token grant type requires 'refresh_token'")
+        self.refresh_token = self.credentials['refresh_token']
+
+    # Grant type setup, resolved once when the class is created
+    _GRANT_TYPE_SETUP: Dict[str, Callable[['OAuth2Authenticator'], None]] = {
+        'client_credentials': _set_up_client_credentials_grant,
+        'authorization_code': _set_up_authorization_code_grant,
+        'password': _set_up_password_grant,
+        'refresh_token': _set_up_refresh_token_grant,
+    }
+
+    @staticmethod
+    async def _read_error_message(response: aiohttp.ClientResponse) -> str:
+        """Extract an error message from a failed token response, reading the body once."""
+        body = await response.read()
+        error_text = body.decode('utf-8', 'replace')
+        try:
+            error_data = json.loads(body)
+        except ValueError:
+            return error_text
+        if isinstance(error_data, dict):
+            return error_data.get('error', error_text)
+        return error_text
 
     async def authenticate(self) -> None:
+        # Reuse a token another authenticator obtained with the same request
+        cached = _TOKEN_CACHE.get(self._token_cache_key) if self._token_cache_key else None
+        if cached and time.monotonic() < cached[2] - _TOKEN_EXPIRY_MARGIN:
+            self._store_token(*cached)
+            return
+
         # Get initial token
-        async with aiohttp.ClientSession() as session:
-            data = {
-                self.client_id_key: self.client_id,
-                self.client_secret_key: self.client_secret,
-            }
-
-            if self.grant_type:
-                data['grant_type'] = self.grant_type
-                match self.grant_type:
-                    case 'password':
-                        data.update({
-                            'username': self.username,
-                            'password': self.password
-                        })
-                    case 'authorization_code':
-                        data.update({
-                            'code': self.credentials['code'],
-                            'redirect_uri': self.redirect_uri
-                        })
-                    case 'refresh_token':
-                        if not self.refresh_token:
-                            raise ValueError("Refresh token grant type requires 'refresh_token'")
-                        
-                        data.update({
-                            'refresh_token': self.refresh_token
-                        })
-                    case _:
-                        raise ValueError(f"Unsupported grant type: {self.grant_type}. "
-                                         f"Supported types are: {', '.join(self.SUPPORTED_GRANT_TYPES)}")
-
-            if self.scope:
-                data['scope'] = self.scope
-
-            async with session.post(self.token_url, data=data) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    try:
-                        error_data = await response.json()
-                        error_msg = error_data.get('error', error_text)
-                    except:
-                        error_msg = error_text
-                    raise ValueError(f"Authentication failed: {error_msg}")
-                
-                token_data = await response.json()
-                self.access_token = token_data[self.access_token_key]
-                self.refresh_token = token_data.get(self.refresh_token_key, self.refresh_token)
-                self.is_authenticated = True
+        body = self._auth_body
+
+        # Only the dynamic fields are encoded per request
+        if self.grant_type == 'authorization_code':
+            body = f"{body}&{urlencode({'code': self.credentials['code']})}"
+        elif self.grant_type == 'refresh_token':
+            if not self.refresh_token:
+                raise ValueError("Refresh token grant type requires 'refresh_token'")
+            body = f"{body}&{urlencode({'refresh_token': self.refresh_token})}"
+
+        await self._request_token(body, "Authentication failed")
 
     async def refresh(self) -> None:
+        # The current token is being replaced, so it must not be handed out again
+        if self._token_cache_key:
+            _TOKEN_CACHE.pop(self._token_cache_key, None)
+
         if not self.refresh_token:
             # No refresh token, get new access token
             await self.authenticate()
             return
 
+        body = self._base_body
+        if self.grant_type == 'refresh_token':
+            body = f"{body}&{urlencode({'refresh_token': self.refresh_token})}"
+
+        await self._request_token(body, "Token refresh failed")
+
+    async def _request_token(self, body: str, error_prefix: str) -> None:
+        """
+        Post a token request and store the returned tokens.
+        
+        Uses the injected HTTP session when it is still open, otherwise a
+        short-lived session is created for this request.
+        
+        Args:
+            body: URL-encoded form body for the token request
+            error_prefix: Prefix for the error message if the request fails
+            
+        Raises:
+            ValueError: If the token endpoint does not return 200
+        """
+        if self.http_session is not None and not self.http_session.closed:
+            await self._post_token_request(self.http_session, body, error_prefix)
+            return
+
         async with aiohttp.ClientSession() as session:
-            data = {
-                self.client_id_key: self.client_id,
-                self.client_secret_key: self.client_secret,
-            }
+            await self._post_token_request(session, body, error_prefix)
+
+    async def _post_token_request(
+        self,
+        session: aiohttp.ClientSession,
+        body: str,
+        error_prefix: str
+    ) -> None:
+        async with session.post(self.token_url, data=body, headers=self.FORM_HEADERS) as response:
+            if response.status != 200:
+                error_msg = await self._read_error_message(response)
+                raise ValueError(f"{error_prefix}: {error_msg}")
             
-            if self.grant_type:
-                data['grant_type'] = self.grant_type
-                if self.grant_type == 'refresh_token':
-                    data.update({
-                        'refresh_token': self.refresh_token
-                    })
-
-
-            async with session.post(self.token_url, data=data) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    try:
-                        error_data = await response.json()
-                        error_msg = error_data.get('error', error_text)
-                    except:
-                        error_msg = error_text
-                    raise ValueError(f"Token refresh failed: {error_msg}")
-                
-                token_data = await response.json()
-                self.access_token = token_data[self.access_token_key]
-                self.refresh_token = token_data.get(self.refresh_token_key, self.refresh_token)
-                self.is_authenticated = True
+            token_data = await response.json(content_type=None)
+            expires_in = token_data.get('expires_in')
+            self._store_token(
+                token_data[self.access_token_key],
+                token_data.get(self.refresh_token_key, self.refresh_token),
+                time.monotonic() + float(expires_in) if expires_in else None
+            )
+
+        # Only tokens with a known lifetime can be shared safely
+        if self._token_cache_key and self._expires_at is not None and self.access_token is not None:
+            if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX_SIZE:
+                _TOKEN_CACHE.pop(next(iter(_TOKEN_CACHE)))
+            _TOKEN_CACHE[self._token_cache_key] = (self.access_token, self.refresh_token, self._expires_at)
+
+    def _store_token(self, access_token: str, refresh_token: Optional[str], expires_at: Optional[float]) -> None:
+        """Store a token and the headers derived from it."""
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self._headers = {'Authorization': f'Bearer {access_token}'}
+        self._expires_at = expires_at
+        self.is_authenticated = True
+
+    def is_token_valid(self) -> bool:
+        if not self.is_authenticated:
+            return False
+        return self._expires_at is None or time.monotonic() < self._expires_at
 
     def get_headers(self) -> Dict[str, str]:
         super().get_headers()  # Check authentication state
-        return {'Authorization': f'Bearer {self.access_token}'} 
\ No newline at end of file
+        return self._headers 
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""Authentication checks shared by the session commands."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    import aiohttp
+    from ...logging import BaseLogger
+    from ..session import Session
+
+# Replacement shown for secret values
+MASK = '*' * 8
+
+# Header names whose whole value is masked when testing authentication
+SENSITIVE_HEADERS = frozenset({'x-api-key', 'api-key'})
+
+# Prefixes that mark a URL or Swagger source as remote
+URL_SCHEMES = ('http://', 'https://')
+
+
+def auth_errors() -> Tuple[type, ...]:
+    """
+    Get the errors reported to the user when talking to an auth server.
+    
+    Returns:
+        Tuple[type, ...]: Invalid configuration, network and timeout errors
+    """
+    import asyncio
+    import aiohttp
+
+    return (ValueError, KeyError, OSError, aiohttp.ClientError, asyncio.TimeoutError)
+
+
+async def check_authentication(
+    session: Session,
+    logger: BaseLogger,
+    http_session: Optional[aiohttp.ClientSession] = None
+) -> None:
+    """
+    Authenticate a session and print its masked auth headers.
+    
+    Args:
+        session: Session with authentication configured
+        logger: Logger used to report the result
+        http_session: Optional HTTP session to share with the authenticator
+    """
+    try:
+        # Sharing the HTTP session builds the authenticator, which fails on
+        # invalid credentials, so it is reported like any other auth failure
+        if http_session is not None:
+            session.use_http_session(http_session)
+        
+        logger.log_info("Testing authentication...")
+        
+        # Authenticate unless the current token is still usable
+        if not session.is_token_valid():
+            await session.authenticate()
+        
+        # Get headers
+        headers = session.get_headers()
+        with logger.buffered():
+            logger.log_info("\nAuthentication successful!")
+            logger.log_info("\nHeaders:")
+            emit = logger.log_info
+            for key, value in headers.items():
+                # Mask the actual token in the output
+                lower_key = key.lower()
+                if lower_key == 'authorization':
+                    scheme, separator, _ = value.partition(' ')
+                    value = f"{scheme} {MASK}" if separator else MASK
+                elif lower_key in SENSITIVE_HEADERS:
+                    value = MASK
+                emit(f"  {key}: {value}")
+    except auth_errors() as e:
+        logger.log_error(f"\nAuthentication failed: {str(e)}")
@@ -1,25 +1,59 @@
-import json
 import asyncio
-from typing import Optional, Dict, Any
-from prompt_toolkit import prompt
-from prompt_toolkit.completion import WordCompleter
-from prompt_toolkit.history import InMemoryHistory
-from prompt_toolkit.validation import Validator, ValidationError
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, Coroutine, Type
 
 from ...logging import BaseLogger
 from ..session_store import SessionStore
-from ..swagger import SwaggerParser, SwaggerParserError, SwaggerSpec
+from .auth_check import URL_SCHEMES, check_authentication
 
-class URLValidator(Validator):
-    """Validator for URLs."""
+# The Swagger stack pulls in requests and yaml, so it is imported only when a
+# spec is actually imported
+if TYPE_CHECKING:
+    from ..swagger import SwaggerParser
+
+# prompt_toolkit is heavy to import, so the validator class is built on first use
+_URL_VALIDATOR_CLS: Optional[Type[Any]] = None
+
+
+def _prompt(message: str, **kwargs: Any) -> str:
+    """
+    Ask the user for input, importing prompt_toolkit on first use.
+    
+    Args:
+        message: Prompt shown to the user
+        **kwargs: Options passed through to prompt_toolkit's prompt
+        
+    Returns:
+        str: Text entered by the user
+    """
+    from prompt_toolkit import prompt
+
+    return prompt(message, **kwargs)
+
+
+def _url_validator() -> Any:
+    """
+    Create a prompt_toolkit validator for URLs.
     
-    def validate(self, document):
-        """Validate that the input is a valid URL."""
-        text = document.text
-        if not text:
-            raise ValidationError(message="URL cannot be empty")
-        if not text.startswith(('http://', 'https://')):
-            raise ValidationError(message="URL must start with http:// or https://")
+    Returns:
+        Validator: Validator rejecting empty and non-HTTP(S) URLs
+    """
+    global _URL_VALIDATOR_CLS
+    if _URL_VALIDATOR_CLS is None:
+        from prompt_toolkit.validation import Validator, ValidationError
+
+        class URLValidator(Validator):
+            """Validator for URLs."""
+            
+            def validate(self, document):
+                """Validate that the input is a valid URL."""
+                text = document.text
+                if not text:
+                    raise ValidationError(message="URL cannot be empty")
+                if not text.startswith(URL_SCHEMES):
+                    raise ValidationError(message="URL must start with http:// or https://")
+
+        _URL_VALIDATOR_CLS = URLValidator
+    return _URL_VALIDATOR_CLS()
 
 class CreateSessionCommand:
     """Command class for creating new API sessions.
@@ -31,7 +65,8 @@ class CreateSessionCommand:
     - Authentication testing
     """
     
-    AUTH_TYPES = ['bearer', 'basic', 'oauth2', 'api_key', 'none']
+    AUTH_TYPES = ('bearer', 'basic', 'oauth2', 'api_key', 'none')
+    _AUTH_TYPES_SET = frozenset(AUTH_TYPES)
     
     def __init__(
         self,
@@ -47,7 +82,41 @@ class CreateSessionCommand:
         """
         self.logger = logger
         self.session_store = session_store
-        self.url_validator = URLValidator()
+        self._url_validator: Optional[Any] = None
+        self._swagger_parser: Optional['SwaggerParser'] = None
+        self._runner: Optional[asyncio.Runner] = None
+        self._auth_prompters: Dict[str, Callable[[], Dict[str, str]]] = {
+            'bearer': self._prompt_bearer_credentials,
+            'basic': self._prompt_basic_credentials,
+            'oauth2': self._prompt_oauth2_credentials,
+            'api_key': self._prompt_api_key_credentials,
+        }
+
+    @property
+    def url_validator(self) -> Any:
+        """
+        Get the URL validator used by interactive prompts.
+        
+        Returns:
+            Validator: Lazily created URL validator
+        """
+        if self._url_validator is None:
+            self._url_validator = _url_validator()
+        return self._url_validator
+
+    @property
+    def swagger_parser(self) -> 'SwaggerParser':
+        """
+        Get the Swagger parser shared across session creations.
+        
+        Returns:
+            SwaggerParser: Lazily created parser instance
+        """
+        if self._swagger_parser is None:
+            from ..swagger import SwaggerParser
+
+            self._swagger_parser = SwaggerParser()
+        return self._swagger_parser
         
     def create_session(self, name: str, interactive: bool = False):
         """
@@ -64,10 +133,12 @@ class CreateSessionCommand:
     
     def create_session_interactive(self, name: str):
         """Create a session in interactive mode."""
+        from prompt_toolkit.completion import WordCompleter
+        from prompt_toolkit.history import InMemoryHistory
+
         # Create histories
         base_url_history = InMemoryHistory()
         auth_type_history = InMemoryHistory()
-        auth_creds_history = InMemoryHistory()
         swagger_url_history = InMemoryHistory()
         
         # Create completers
@@ -75,92 +146,47 @@ class CreateSessionCommand:
         
         try:
             # Get base URL
-            base_url = prompt(
+            base_url = _prompt(
                 "Base URL (e.g., https://api.example.com): ",
                 validator=self.url_validator,
                 history=base_url_history
             )
             
             # Ask about authentication
-            auth_type = prompt(
+            auth_type = _prompt(
                 "Authentication type (bearer/basic/oauth2/api_key/none): ",
                 completer=auth_type_completer,
                 history=auth_type_history
             ).lower()
             
+            if auth_type not in self._AUTH_TYPES_SET:
+                self.logger.log_error(f"Unsupported authentication type: {auth_type}")
+                return
+            
             # Handle authentication setup
             auth_credentials = None
             if auth_type != 'none':
                 self.logger.log_info("\nAuthentication Setup:")
-                if auth_type == 'bearer':
-                    self.logger.log_info("Bearer token authentication")
-                    token = prompt("Enter bearer token: ")
-                    auth_credentials = {"token": token}
-                    
-                elif auth_type == 'basic':
-                    self.logger.log_info("Basic authentication")
-                    username = prompt("Enter username: ")
-                    password = prompt("Enter password: ", is_password=True)
-                    auth_credentials = {
-                        "username": username,
-                        "password": password
-                    }
-                    
-                elif auth_type == 'oauth2':
-                    self.logger.log_info("\n⚠️  OAuth2 Authentication Setup")
-                    self.logger.log_info("Note: OAuth2 implementation varies across APIs. This setup provides basic support")
-                    self.logger.log_info("and may need adjustments based on your specific API requirements.")
-                    
-                    # Required fields
-                    client_id = prompt("Enter client ID: ")
-                    client_secret = prompt("Enter client secret: ", is_password=True)
-                    token_url = prompt("Enter token URL: ", validator=self.url_validator)
-                    scope = prompt("Enter scope (optional): ")
-                    
-                    # Optional key mappings
-                    self.logger.log_info("\nOptional: Configure custom key mappings (press Enter to use defaults)")
-                    client_id_key = prompt("Client ID key (default: client_id): ", default="client_id")
-                    client_secret_key = prompt("Client secret key (default: client_secret): ", default="client_secret")
-                    access_token_key = prompt("Access token key (default: access_token): ", default="access_token")
-                    refresh_token_key = prompt("Refresh token key (default: refresh_token): ", default="refresh_token")
-                    
-                    auth_credentials = {
-                        "client_id": client_id,
-                        "client_secret": client_secret,
-                        "token_url": token_url,
-                        "client_id_key": client_id_key,
-                        "client_secret_key": client_secret_key,
-                        "access_token_key": access_token_key,
-                        "refresh_token_key": refresh_token_key
-                    }
-                    if scope:
-                        auth_credentials["scope"] = scope
-                    
-                elif auth_type == 'api_key':
-                    self.logger.log_info("API Key authentication")
-                    api_key = prompt("Enter API key: ", is_password=True)
-                    header_name = prompt("Enter header name (e.g., X-API-Key): ")
-                    auth_credentials = {
-                        "api_key": api_key,
-                        "header_name": header_name
-                    }
+                auth_credentials = self._auth_prompters[auth_type]()
             
             # Ask about Swagger/OpenAPI
-            has_swagger = prompt(
+            has_swagger = _prompt(
                 "Do you want to import Swagger/OpenAPI specification? (y/N): ",
                 default="N"
             ).lower() == 'y'
             
             swagger_spec_path = None
             if has_swagger:
-                swagger_source = prompt(
+                swagger_source = _prompt(
                     "Enter Swagger URL or file path: ",
                     history=swagger_url_history
                 )
                 
                 try:
+                    from ..swagger import SwaggerSpec
+
                     # Parse specification
-                    parser = SwaggerParser()
+                    parser = self.swagger_parser
                     spec = parser.parse(swagger_source)
                     
                     # Validate specification
@@ -175,28 +201,27 @@ class CreateSessionCommand:
                     
                 except Exception as e:
                     self.logger.log_error(f"Failed to import Swagger specification: {str(e)}")
-                    if prompt("Continue without Swagger? (y/N): ", default="N").lower() != 'y':
+                    if _prompt("Continue without Swagger? (y/N): ", default="N").lower() != 'y':
                         return
             
-            # Prepare session data
+            # Prepare session data with every key up front; Session.from_dict
+            # treats a None swagger_spec_path the same as a missing one
             session_data = {
                 'base_url': base_url,
                 'auth': {
                     'type': auth_type,
                     'credentials': auth_credentials
-                } if auth_type != 'none' else None
+                } if auth_type != 'none' else None,
+                'swagger_spec_path': swagger_spec_path
             }
             
-            if swagger_spec_path:
-                session_data['swagger_spec_path'] = swagger_spec_path
-            
             # Create session
-            self.session_store.upsert_session(name, json.dumps(session_data))
+            self.session_store.upsert_session(name, session_data)
             self.logger.log_info(f"\nSession '{name}' created successfully!")
             
             # Test authentication if configured
             if auth_type != 'none':
-                if prompt("Test authentication? (y/N): ", default="N").lower() == 'y':
+                if _prompt("Test authentication? (y/N): ", default="N").lower() == 'y':
                     self.test_authentication(name)
             
         except KeyboardInterrupt:
@@ -204,6 +229,64 @@ class CreateSessionCommand:
         except Exception as e:
             self.logger.log_error(f"Failed to create session: {str(e)}")
     
+    def _prompt_bearer_credentials(self) -> Dict[str, str]:
+        """Prompt for bearer token credentials."""
+        self.logger.log_info("Bearer token authentication")
+        token = _prompt("Enter bearer token: ")
+        return {"token": token}
+
+    def _prompt_basic_credentials(self) -> Dict[str, str]:
+        """Prompt for basic authentication credentials."""
+        self.logger.log_info("Basic authentication")
+        username = _prompt("Enter username: ")
+        password = _prompt("Enter password: ", is_password=True)
+        return {
+            "username": username,
+            "password": password
+        }
+
+    def _prompt_oauth2_credentials(self) -> Dict[str, str]:
+        """Prompt for OAuth2 credentials and optional key mappings."""
+        self.logger.log_info("\n⚠️  OAuth2 Authentication Setup")
+        self.logger.log_info("Note: OAuth2 implementation varies across APIs. This setup provides basic support")
+        self.logger.log_info("and may need adjustments based on your specific API requirements.")
+        
+        # Required fields
+        client_id = _prompt("Enter client ID: ")
+        client_secret = _prompt("Enter client secret: ", is_password=True)
+        token_url = _prompt("Enter token URL: ", validator=self.url_validator)
+        scope = _prompt("Enter scope (optional): ")
+        
+        # Optional key mappings
+        self.logger.log_info("\nOptional: Configure custom key mappings (press Enter to use defaults)")
+        client_id_key = _prompt("Client ID key (default: client_id): ", default="client_id")
+        client_secret_key = _prompt("Client secret key (default: client_secret): ", default="client_secret")
+        access_token_key = _prompt("Access token key (default: access_token): ", default="access_token")
+        refresh_token_key = _prompt("Refresh token key (default: refresh_token): ", default="refresh_token")
+        
+        auth_credentials = {
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "token_url": token_url,
+            "client_id_key": client_id_key,
+            "client_secret_key": client_secret_key,
+            "access_token_key": access_token_key,
+            "refresh_token_key": refresh_token_key
+        }
+        if scope:
+            auth_credentials["scope"] = scope
+        return auth_credentials
+
+    def _prompt_api_key_credentials(self) -> Dict[str, str]:
+        """Prompt for API key credentials."""
+        self.logger.log_info("API Key authentication")
+        api_key = _prompt("Enter API key: ", is_password=True)
+        header_name = _prompt("Enter header name (e.g., X-API-Key): ")
+        return {
+            "api_key": api_key,
+            "header_name": header_name
+        }
+    
     def test_authentication(self, name: str):
         """Test authentication for a session."""
         try:
@@ -213,29 +296,24 @@ class CreateSessionCommand:
                 self.logger.log_error(f"Session '{name}' has no authentication configured")
                 return
 
-            # Run the authentication test
-            async def test_auth():
-                try:
-                    self.logger.log_info("Testing authentication...")
-                    
-                    # Authenticate if needed
-                    if not session.is_authenticated():
-                        await session.authenticate()
-                    
-                    # Get headers
-                    headers = session.get_headers()
-                    self.logger.log_info("\nAuthentication successful!")
-                    self.logger.log_info("\nHeaders:")
-                    for key, value in headers.items():
-                        # Mask sensitive values
-                        if key.lower() in {'authorization', 'x-api-key', 'api-key'}:
-                            value = '*' * 8
-                        self.logger.log_info(f"  {key}: {value}")
-                except Exception as e:
-                    self.logger.log_error(f"\nAuthentication failed: {str(e)}")
-
-            # Run the async test
-            asyncio.run(test_auth())
+            self._run(check_authentication(session, self.logger))
             
         except Exception as e:
-            self.logger.log_error(f"Failed to test authentication: {str(e)}") 
\ No newline at end of file
+            self.logger.log_error(f"Failed to test authentication: {str(e)}") 
+
+    def _run(self, coro: Coroutine[Any, Any, None]) -> None:
+        """
+        Run a coroutine on the command's persistent event loop.
+        
+        Args:
+            coro: Coroutine to run to completion
+        """
+        if self._runner is None:
+            self._runner = asyncio.Runner()
+        self._runner.run(coro)
+
+    def close(self) -> None:
+        """Close the persistent event loop, if one was started."""
+        if self._runner is not None:
+            self._runner.close()
+            self._runner = None
@@ -1,15 +1,124 @@
+from __future__ import annotations
+
+import atexit
 import click
-import json
-import asyncio
-from typing import Dict, Any
-from prompt_toolkit import prompt
-from ..logging import BaseLogger
-from .session_store import SessionStore
-from .swagger import SwaggerParser, SwaggerParserError, SwaggerSpec
-from .command.create_session import CreateSessionCommand
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Coroutine, Optional, Tuple
+
+from .command.auth_check import MASK, URL_SCHEMES, auth_errors, check_authentication
+
+# Heavy modules are imported inside the commands that use them, so a simple
+# command like `session delete` does not pay for the HTTP and prompt stacks
+if TYPE_CHECKING:
+    import asyncio
+    from pydantic import TypeAdapter
+    from ..logging import BaseLogger
+    from .session_store import SessionStore
+
+# Credentials are a flat JSON object of strings, parsed and validated in one pass
+_CREDENTIALS_ADAPTER: Optional[TypeAdapter] = None
+
+# Credential keys masked when showing a session
+_SENSITIVE_KEYS = frozenset({'token', 'password', 'client_secret', 'api_key', 'refresh_token', 'code'})
+
+# Optional line prefixes in `session list` output
+_AUTH_TYPE_LINE = "\nAuth Type: "
+_SWAGGER_LINE = "\nSwagger: "
+
+# Errors reported to the user; anything else is a bug and propagates to Click
+_USER_ERRORS = (ValueError, KeyError, OSError, click.ClickException)
+
+# Auth types accepted by the create and update commands
+_AUTH_TYPES = ('bearer', 'basic', 'oauth2', 'api_key')
+_AUTH_TYPES_WITH_NONE = _AUTH_TYPES + ('none',)
 
+# Event loop runner reused by every async command in this process
+_runner: Optional[asyncio.Runner] = None
+
+
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """
+    Run a coroutine on the process-wide event loop.
+    
+    Args:
+        coro: Coroutine to run to completion
+    """
+    import asyncio
+
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner()
+        atexit.register(_runner.close)
+    _runner.run(coro)
+
+
+def _parse_credentials(raw: str, logger: BaseLogger) -> Optional[Dict[str, str]]:
+    """
+    Parse and validate auth credentials given as a JSON string.
+    
+    Args:
+        raw: JSON object mapping credential names to string values
+        logger: Logger used to report invalid input
+        
+    Returns:
+        Optional[Dict[str, str]]: Parsed credentials, or None if the input is invalid
+    """
+    from pydantic import TypeAdapter, ValidationError
+
+    global _CREDENTIALS_ADAPTER
+    if _CREDENTIALS_ADAPTER is None:
+        _CREDENTIALS_ADAPTER = TypeAdapter(Dict[str, str])
+    try:
+        return _CREDENTIALS_ADAPTER.validate_json(raw)
+    except ValidationError as e:
+        details = '; '.join(error['msg'] for error in e.errors(include_url=False))
+        logger.log_error(f"Invalid auth credentials: {details}")
+        return None
+
+
+@lru_cache(maxsize=128)
+def _render_show(
+    name: str,
+    base_url: str,
+    auth_type: Optional[str],
+    credential_items: Tuple[Tuple[str, str], ...],
+    swagger_source: Optional[str]
+) -> str:
+    """
+    Render the output of the show command, masking sensitive credentials.
+    
+    Args:
+        name: Name of the session
+        base_url: Base URL of the session
+        auth_type: Authentication type, or None if auth is not configured
+        credential_items: Sorted credential key/value pairs
+        swagger_source: Swagger spec location, or None if not imported
+        
+    Returns:
+        str: Multi-line session description
+    """
+    lines = [f"Session: {name}", f"Base URL: {base_url}"]
+    
+    if auth_type is not None:
+        lines.append("\nAuthentication:")
+        lines.append(f"  Type: {auth_type}")
+        lines.append("  Credentials:")
+        # Mask sensitive values
+        lines.extend(
+            f"    {key}: {MASK if key in _SENSITIVE_KEYS else value}"
+            for key, value in credential_items
+        )
+    
+    if swagger_source is not None:
+        lines.append("\nSwagger/OpenAPI:")
+        lines.append(f"  Specification: {swagger_source}")
+        
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=1)
 def create_session_commands() -> click.Group:
-    """Create the session command group."""
+    """Create the session command group, building it once per process."""
     
     @click.group(name='session')
     def session():
@@ -21,7 +130,7 @@ def create_session_commands() -> click.Group:
     @click.option('-i', '--interactive', is_flag=True, help='Run in interactive mode')
     @click.option('--base-url', help='Base URL for the API')
     @click.option('--auth-type', 
-                 type=click.Choice(['bearer', 'basic', 'oauth2', 'api_key']),
+                 type=click.Choice(_AUTH_TYPES),
                  help='Authentication type')
     @click.option('--auth-credentials',
                  help='Authentication credentials as JSON string. Examples:\n'
@@ -70,12 +179,15 @@ def create_session_commands() -> click.Group:
             # Create a session interactively
             restbook session create my-api -i
         """
+        from .command.create_session import CreateSessionCommand
+
         try:
             session_store: SessionStore = ctx.obj.session_store
             logger: BaseLogger = ctx.obj.logger
             
             # Create session command
             session_command = CreateSessionCommand(logger, session_store)
+            ctx.call_on_close(session_command.close)
             
             if interactive:
                 # Run interactive mode
@@ -86,23 +198,29 @@ def create_session_commands() -> click.Group:
                     logger.log_error("Base URL is required in non-interactive mode")
                     return
                     
+                credentials = None
+                if auth_type and auth_credentials:
+                    credentials = _parse_credentials(auth_credentials, logger)
+                    if credentials is None:
+                        return
+                    
                 session_data = {
                     'base_url': base_url,
                     'auth': {
                         'type': auth_type,
-                        'credentials': json.loads(auth_credentials)
-                    } if auth_type and auth_credentials else None
+                        'credentials': credentials
+                    } if credentials is not None else None
                 }
                 
                 # Create session
-                session_store.upsert_session(name, json.dumps(session_data))
+                session_store.upsert_session(name, session_data)
                 logger.log_info(f"Session '{name}' created successfully")
                 
                 # Test authentication if configured
-                if auth_type and prompt("Test authentication? (y/N): ", default="N").lower() == 'y':
+                if auth_type and click.confirm("Test authentication?", default=False):
                     session_command.test_authentication(name)
             
-        except Exception as e:
+        except _USER_ERRORS as e:
             logger.log_error(str(e))
 
     @session.command(name='list')
@@ -118,16 +236,20 @@ def create_session_commands() -> click.Group:
                 logger.log_info("No sessions found")
                 return
                 
+            # Build one string per session and emit them in a single write
+            swagger_specs = session_store.available_swagger_specs()
+            entries = []
+            add = entries.append
             for name, session in sessions.items():
-                logger.log_info(f"\nSession: {name}")
-                logger.log_info(f"Base URL: {session.base_url}")
-                if session.auth_config:
-                    logger.log_info(f"Auth Type: {session.auth_config.type}")
-                if session.has_swagger():
-                    swagger_source = session.get_swagger_source()
-                    logger.log_info(f"Swagger: {swagger_source}")
+                auth_line = f"{_AUTH_TYPE_LINE}{session.auth_config.type}" if session.auth_config else ""
+                swagger_line = (
+                    f"{_SWAGGER_LINE}{session.swagger_spec_path}"
+                    if session.swagger_spec_path in swagger_specs else ""
+                )
+                add(f"\nSession: {name}\nBase URL: {session.base_url}{auth_line}{swagger_line}")
+            logger.log_info("\n".join(entries))
                     
-        except Exception as e:
+        except _USER_ERRORS as e:
             logger.log_error(str(e))
 
     @session.command(name='import-swagger')
@@ -140,6 +262,8 @@ def create_session_commands() -> click.Group:
         
         SOURCE can be either a URL or a local file path.
         """
+        from .swagger import SwaggerParser, SwaggerParserError, SwaggerSpec
+
         try:
             session_store: SessionStore = ctx.obj.session_store
             logger: BaseLogger = ctx.obj.logger
@@ -148,7 +272,7 @@ def create_session_commands() -> click.Group:
             session = session_store.get_session(name)
 
             # Infer source type
-            is_url = source.startswith(('http://', 'https://'))
+            is_url = source.startswith(URL_SCHEMES)
             source_type = 'url' if is_url else 'file'
             
             logger.log_info(f"Importing Swagger specification from {source_type}: {source}")
@@ -161,7 +285,7 @@ def create_session_commands() -> click.Group:
                 try:
                     SwaggerSpec.model_validate(spec)
                     logger.log_info("Swagger specification is valid")
-                except Exception as e:
+                except _USER_ERRORS as e:
                     logger.log_error(f"Invalid Swagger specification: {str(e)}")
                     return
             
@@ -171,14 +295,15 @@ def create_session_commands() -> click.Group:
             
             # Update session
             session.swagger_spec_path = spec_path
+            session.refresh_swagger_path()
             
             # Save session
-            session_store.upsert_session(name, json.dumps(session.to_dict()), overwrite=True)
+            session_store.upsert_session(name, session.to_dict(), overwrite=True)
             
             logger.log_info(f"Successfully imported Swagger specification for session '{name}'")
             logger.log_info(f"Found {len(spec.paths)} endpoints")
             
-        except Exception as e:
+        except (*_USER_ERRORS, SwaggerParserError) as e:
             logger.log_error(f"Failed to import Swagger specification: {str(e)}")
             raise click.Abort()
 
@@ -187,7 +312,7 @@ def create_session_commands() -> click.Group:
     @click.option('--new-name', help='New name for the session')
     @click.option('--base-url', help='New base URL for the API')
     @click.option('--auth-type', 
-                 type=click.Choice(['bearer', 'basic', 'oauth2', 'none']),
+                 type=click.Choice(_AUTH_TYPES_WITH_NONE),
                  help='New authentication type (use "none" to remove authentication)')
     @click.option('--auth-credentials',
                  help='New authentication credentials as JSON string. Examples:\n'
@@ -228,9 +353,26 @@ def create_session_commands() -> click.Group:
             session_store: SessionStore = ctx.obj.session_store
             logger: BaseLogger = ctx.obj.logger
             
+            # Renames and base URL changes don't touch auth, so skip the rebuild
+            if not auth_type and not auth_credentials and bool(new_name) != bool(base_url):
+                if new_name:
+                    session_store.rename_session(name, new_name)
+                    name = new_name
+                elif base_url == session_store.get_session(name).base_url:
+                    logger.log_info(f"Session '{name}' unchanged")
+                    return
+                else:
+                    session_store.set_base_url(name, base_url)
+                logger.log_info(f"Session '{name}' updated successfully")
+                return
+            
             # Get current session
             current_session = session_store.get_session(name)
             
+            # Never replace another session when renaming, as rename_session does
+            if new_name and new_name != name and new_name in session_store.list_sessions():
+                raise ValueError(f"Session '{new_name}' already exists")
+            
             # Prepare updated session data
             session_data: Dict[str, Any] = {
                 'base_url': base_url or current_session.base_url,
@@ -242,10 +384,14 @@ def create_session_commands() -> click.Group:
                 session_data['auth'] = None
             elif auth_type or auth_credentials:
                 current_auth = current_session.auth_config
+                credentials = current_auth.credentials if current_auth else None
+                if auth_credentials:
+                    credentials = _parse_credentials(auth_credentials, logger)
+                    if credentials is None:
+                        return
                 session_data['auth'] = {
                     'type': auth_type or (current_auth.type if current_auth else None),
-                    'credentials': json.loads(auth_credentials) if auth_credentials else 
-                                 (current_auth.credentials if current_auth else None)
+                    'credentials': credentials
                 }
             else:
                 session_data['auth'] = None if current_session.auth_config is None else {
@@ -257,17 +403,30 @@ def create_session_commands() -> click.Group:
             if current_session.swagger_spec_path:
                 session_data['swagger_spec_path'] = current_session.swagger_spec_path
             
+            # Skip the store write when nothing would change
+            if not new_name:
+                current_auth = current_session.auth_config
+                current = (current_session.base_url, None if current_auth is None else {
+                    'type': current_auth.type,
+                    'credentials': current_auth.credentials
+                })
+                if (session_data['base_url'], session_data['auth']) == current:
+                    logger.log_info(f"Session '{name}' unchanged")
+                    return
             
-            # Delete old session if name is changing
-            if new_name:
-                session_store.delete_session(name)
-                name = new_name
-            
-            # Create/update session
-            session_store.upsert_session(name, json.dumps(session_data), overwrite=True)
+            # Write the rename and the new data to disk together
+            with session_store.batch():
+                # Create/update session first, so invalid auth settings are
+                # rejected before the old session is touched
+                session_store.upsert_session(new_name or name, session_data, overwrite=True)
+                
+                # Delete old session if name is changing
+                if new_name and new_name != name:
+                    session_store.delete_session(name)
+                    name = new_name
             logger.log_info(f"Session '{name}' updated successfully")
             
-        except Exception as e:
+        except _USER_ERRORS as e:
             logger.log_error(str(e))
 
     @session.command(name='delete')
@@ -281,7 +440,7 @@ def create_session_commands() -> click.Group:
             session_store.delete_session(name)
             logger.log_info(f"Session '{name}' deleted successfully")
             
-        except Exception as e:
+        except _USER_ERRORS as e:
             logger.log_error(str(e))
 
     @session.command(name='show')
@@ -296,25 +455,20 @@ def create_session_commands() -> click.Group:
             # Get session
             session = session_store.get_session(name)
             
-            # Display session info
-            logger.log_info(f"Session: {name}")
-            logger.log_info(f"Base URL: {session.base_url}")
-            
-            if session.auth_config:
-                logger.log_info("\nAuthentication:")
-                logger.log_info(f"  Type: {session.auth_config.type}")
-                logger.log_info("  Credentials:")
-                for key, value in session.auth_config.credentials.items():
-                    # Mask sensitive values
-                    if key in {'token', 'password', 'client_secret'}:
-                        value = '*' * 8
-                    logger.log_info(f"    {key}: {value}")
-            
-            if session.has_swagger():
-                logger.log_info("\nSwagger/OpenAPI:")
-                logger.log_info(f"  Specification: {session.get_swagger_source()}")
+            # Display session info in a single write
+            auth_config = session.auth_config
+            logger.log_info(_render_show(
+                name,
+                session.base_url,
+                auth_config.type if auth_config else None,
+                # Credentials loaded from disk may hold non-string values;
+                # stringify them so they can be part of the cache key
+                tuple(sorted((key, str(value)) for key, value in auth_config.credentials.items()))
+                if auth_config else (),
+                session.get_swagger_source() if session.has_swagger() else None
+            ))
                     
-        except Exception as e:
+        except _USER_ERRORS as e:
             logger.log_error(str(e))
 
     @session.command(name='authenticate')
@@ -340,32 +494,46 @@ def create_session_commands() -> click.Group:
                 return
 
             # Run the authentication test
-            async def test_auth():
-                try:
-                    logger.log_info("Testing authentication...")
-                    
-                    # Authenticate if needed
-                    if not session.is_authenticated():
-                        await session.authenticate()
-                    
-                    # Get headers
-                    headers = session.get_headers()
-                    logger.log_info("\nAuthentication successful!")
-                    logger.log_info("\nHeaders:")
-                    for key, value in headers.items():
-                        # Mask the actual token in the output
-                        if key.lower() == 'authorization':
-                            parts = value.split(' ')
-                            if len(parts) > 1:
-                                value = f"{parts[0]} {'*' * 8}"
-                        logger.log_info(f"  {key}: {value}")
-                except Exception as e:
-                    logger.log_error(f"\nAuthentication failed: {str(e)}")
-
-            # Run the async test
-            asyncio.run(test_auth())
-            
-        except Exception as e:
+            _run(check_authentication(session, logger))
+            
+        except _USER_ERRORS as e:
+            logger.log_error(str(e))
+
+    @session.command(name='batch-authenticate')
+    @click.argument('names', nargs=-1, required=True)
+    @click.pass_context
+    def batch_authenticate(ctx, names: Tuple[str, ...]) -> None:
+        """
+        Test authentication for several sessions.
+        
+        All sessions are tested on one event loop and share a single HTTP
+        connection pool.
+        
+        Examples:
+            # Test authentication for multiple sessions
+            restbook session batch-authenticate my-api other-api
+        """
+        import aiohttp
+
+        try:
+            session_store: SessionStore = ctx.obj.session_store
+            logger: BaseLogger = ctx.obj.logger
+            
+            # Resolve every session up front so a typo fails before any request
+            sessions = [session_store.get_session(name) for name in names]
+
+            async def test_all() -> None:
+                async with aiohttp.ClientSession() as http_session:
+                    for session in sessions:
+                        logger.log_info(f"\nSession: {session.name}")
+                        if not session.auth_config:
+                            logger.log_error(f"Session '{session.name}' has no authentication configured")
+                            continue
+                        await check_authentication(session, logger, http_session)
+
+            _run(test_all())
+            
+        except (*_USER_ERRORS, *auth_errors()) as e:
             logger.log_error(str(e))
 
     return session 
\ No newline at end of file
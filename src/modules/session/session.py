@@ -1,19 +1,55 @@
+from __future__ import annotations
+
 import os
-import uuid
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
 from .auth import AuthConfig, create_authenticator, Authenticator
-from .swagger import SwaggerClient, SwaggerClientFactory
 from ..request.circuit_breaker import CircuitBreaker
 
-@dataclass
+# The swagger stack (pydantic models, YAML, requests) is only imported once a
+# session's Swagger client is actually needed
+if TYPE_CHECKING:
+    import aiohttp
+    from .swagger import SwaggerClient
+
+# Fields written by to_dict; assigning any of them drops the cached dict
+_PERSISTED_FIELDS = frozenset({
+    'base_url', 'auth_config', 'swagger_spec_path', 'retry_config',
+    'validate_ssl', 'timeout', 'circuit_breaker'
+})
+
+@dataclass(slots=True)
 class RetryConfig:
     """Simple retry configuration for sessions."""
     max_retries: int = 2
     backoff_factor: float = 1.0
     max_delay: Optional[int] = None
 
-@dataclass
+def _build_auth(data: Dict[str, Any]) -> AuthConfig:
+    return AuthConfig(type=data['type'], credentials=data['credentials'])
+
+def _build_retry(data: Dict[str, Any]) -> RetryConfig:
+    return RetryConfig(
+        max_retries=data.get('max_retries', 2),
+        backoff_factor=data.get('backoff_factor', 1.0),
+        max_delay=data.get('max_delay')
+    )
+
+def _build_circuit_breaker(data: Dict[str, Any]) -> CircuitBreaker:
+    return CircuitBreaker(
+        threshold=data.get('threshold', 2),
+        reset_timeout=data.get('reset', 10),
+        jitter=data.get('jitter', 0.0)
+    )
+
+# (stored key, Session field, builder) for the nested configs read by from_dict
+_NESTED_FIELDS = (
+    ('auth', 'auth_config', _build_auth),
+    ('retry', 'retry_config', _build_retry),
+    ('circuit_breaker', 'circuit_breaker', _build_circuit_breaker),
+)
+
+@dataclass(slots=True)
 class Session:
     """Represents an API session with authentication."""
     name: str
@@ -25,51 +61,105 @@ class Session:
     timeout: Optional[int] = None
     circuit_breaker: Optional[CircuitBreaker] = None
     
-    def __post_init__(self):
-        """Initialize the authenticator if auth config is provided."""
-        self.authenticator: Optional[Authenticator] = None
-        self._swagger_client: Optional[SwaggerClient] = None
+    # Runtime state, declared as fields so it gets a slot
+    _authenticator: Optional[Authenticator] = field(default=None, init=False, repr=False, compare=False)
+    _swagger_client: Optional[Tuple[str, Optional[SwaggerClient]]] = field(default=None, init=False, repr=False, compare=False)
+    _swagger_exists: Optional[Tuple[str, bool]] = field(default=None, init=False, repr=False, compare=False)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, invalidating the cached dict for persisted fields."""
+        if name in _PERSISTED_FIELDS:
+            object.__setattr__(self, '_dict_cache', None)
+        object.__setattr__(self, name, value)
+    
+    @property
+    def authenticator(self) -> Optional[Authenticator]:
+        """
+        Get the authenticator for this session.
         
-        if self.auth_config:
-            self.authenticator = create_authenticator(self.auth_config)
+        The authenticator is built on first access, so loading a store with
+        many sessions does not set up auth for sessions that are never used.
+        
+        Returns:
+            Optional[Authenticator]: Authenticator instance or None if auth is not configured
+            
+        Raises:
+            ValueError: If the auth configuration is invalid
+        """
+        if self._authenticator is None and self.auth_config:
+            self._authenticator = create_authenticator(self.auth_config)
+        return self._authenticator
 
     async def authenticate(self) -> None:
         """Authenticate the session if needed."""
-        if not self.authenticator:
+        authenticator = self.authenticator
+        if not authenticator:
             return
         try:
-            await self.authenticator.authenticate()
+            await authenticator.authenticate()
         except Exception as e:
-            self.authenticator.is_authenticated = False
+            authenticator.is_authenticated = False
             raise ValueError(f"Authentication failed: {str(e)}")
 
     async def refresh_auth(self) -> None:
         """Refresh authentication if possible."""
-        if not self.authenticator:
+        authenticator = self.authenticator
+        if not authenticator:
             return
         try:
-            await self.authenticator.refresh()
+            await authenticator.refresh()
         except Exception as e:
-            self.authenticator.is_authenticated = False
+            authenticator.is_authenticated = False
             raise ValueError(f"Authentication refresh failed: {str(e)}")
 
+    def use_http_session(self, http_session: aiohttp.ClientSession) -> None:
+        """
+        Share an HTTP session with the authenticator.
+        
+        Args:
+            http_session: HTTP session owned by the caller
+        """
+        authenticator = self.authenticator
+        if authenticator:
+            authenticator.http_session = http_session
+
     def get_headers(self) -> Dict[str, str]:
         """Get headers for the request, including authentication if configured."""
-        if not self.authenticator:
+        authenticator = self.authenticator
+        if not authenticator:
             return {}
         try:
-            return self.authenticator.get_headers()
+            return authenticator.get_headers()
         except ValueError as e:
             # Re-raise with more context
             raise ValueError(f"Failed to get authentication headers: {str(e)}")
 
     def is_authenticated(self) -> bool:
         """Check if the session is authenticated."""
-        return self.authenticator.is_authenticated if self.authenticator else True
+        authenticator = self.authenticator
+        return authenticator.is_authenticated if authenticator else True
+
+    def is_token_valid(self) -> bool:
+        """Check if the session's credentials can be used without re-authenticating."""
+        authenticator = self.authenticator
+        return authenticator.is_token_valid() if authenticator else True
 
     def has_swagger(self) -> bool:
         """Check if the session has a Swagger specification."""
-        return bool(self.swagger_spec_path) and os.path.exists(self.swagger_spec_path or "")
+        spec_path = self.swagger_spec_path
+        if not spec_path:
+            return False
+            
+        # Only stat the spec file again when the path changes
+        if self._swagger_exists is None or self._swagger_exists[0] != spec_path:
+            self._swagger_exists = (spec_path, os.path.exists(spec_path))
+        return self._swagger_exists[1]
+
+    def refresh_swagger_path(self) -> None:
+        """Forget the cached spec file check and client, e.g. after the spec file was rewritten."""
+        self._swagger_exists = None
+        self._swagger_client = None
 
     def get_swagger_source(self) -> Optional[str]:
         """Get the path to the Swagger specification."""
@@ -83,56 +173,50 @@ class Session:
         Returns:
             SwaggerClient: Swagger client instance or None if not available
         """
-        if not self.has_swagger() or not self.swagger_spec_path:
+        spec_path = self.swagger_spec_path
+        if not spec_path or not self.has_swagger():
             return None
             
-        # Lazy initialization
-        if self._swagger_client is None:
-            self._swagger_client = SwaggerClientFactory.create_from_file(self.swagger_spec_path)
+        # Lazy initialization, redone only when the spec path changes. The
+        # factory itself shares clients between sessions using the same file.
+        if self._swagger_client is None or self._swagger_client[0] != spec_path:
+            from .swagger import SwaggerClientFactory
+            self._swagger_client = (spec_path, SwaggerClientFactory.create_from_file(spec_path))
             
-        return self._swagger_client
+        return self._swagger_client[1]
 
     @classmethod
     def from_dict(cls, name: str, data: Dict[str, Any]) -> 'Session':
         """Create a session from a dictionary."""
-        auth_config = None
-        if 'auth' in data and data['auth'] is not None:
-            auth_config = AuthConfig(
-                type=data['auth']['type'],
-                credentials=data['auth']['credentials']
-            )
-        
-        retry_config = None
-        if 'retry' in data and data['retry'] is not None:
-            retry_data = data['retry']
-            retry_config = RetryConfig(
-                max_retries=retry_data.get('max_retries', 2),
-                backoff_factor=retry_data.get('backoff_factor', 1.0),
-                max_delay=retry_data.get('max_delay')
-            )
+        kwargs: Dict[str, Any] = {
+            'name': name,
+            'base_url': data['base_url'],
+            'swagger_spec_path': data.get('swagger_spec_path'),
+            'validate_ssl': data.get('validate_ssl'),
+            'timeout': data.get('timeout'),
+        }
+        for key, field_name, build in _NESTED_FIELDS:
+            value = data.get(key)
+            if value is not None:
+                kwargs[field_name] = build(value)
+        return cls(**kwargs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the session to a dictionary.
         
-        circuit_breaker = None
-        if 'circuit_breaker' in data and data['circuit_breaker'] is not None:
-            cb_data = data['circuit_breaker']
-            circuit_breaker = CircuitBreaker(
-                threshold=cb_data.get('threshold', 2),
-                reset_timeout=cb_data.get('reset', 10),
-                jitter=cb_data.get('jitter', 0.0)
-            )
+        The result is cached until a persisted field is reassigned, so it is
+        shared between calls and must not be mutated.
         
-        return cls(
-            name=name,
-            base_url=data['base_url'],
-            auth_config=auth_config,
-            swagger_spec_path=data.get('swagger_spec_path'),
-            retry_config=retry_config,
-            validate_ssl=data.get('validate_ssl'),
-            timeout=data.get('timeout'),
-            circuit_breaker=circuit_breaker
-        )
+        Returns:
+            Dict[str, Any]: Serializable session data
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert the session to a dictionary."""
+    def _build_dict(self) -> Dict[str, Any]:
+        """Build the dictionary form of the session."""
         data: Dict[str, Any] = {
             'base_url': self.base_url,
             'auth': None
@@ -1,16 +1,29 @@
 import os
-import json
-from typing import Dict, Any
+import logging
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Set, Tuple, Union
 from .session import Session
+from . import serialization
+
+logger = logging.getLogger(__name__)
 
 
 class SessionStore:
     """Manages persistent storage of API sessions."""
     
-    def __init__(self, sessions_file: str = "~/.restbook/sessions.json"):
+    def __init__(self, sessions_file: str = "~/.restbook/sessions.json", pretty: bool = False):
         self.sessions_file = os.path.expanduser(sessions_file)
+        # Compact JSON is smaller and faster to write; pretty output is opt-in
+        self.pretty = pretty
         os.makedirs(os.path.dirname(self.sessions_file), exist_ok=True)
         self.sessions: Dict[str, Session] = {}
+        # Nesting depth of batch() blocks and whether a save was deferred
+        self._batch_depth = 0
+        self._save_pending = False
+        # Encoded JSON per session, kept with the to_dict result it came from
+        self._fragments: Dict[str, Tuple[Dict[str, Any], bytes]] = {}
         self._load_sessions()
 
     def get_session(self, name: str) -> Session:
@@ -26,40 +39,126 @@ class SessionStore:
         Raises:
             ValueError: If the session does not exist
         """
-        if name not in self.sessions:
+        session = self.sessions.get(name)
+        if session is None:
             raise ValueError(f"Session '{name}' not found")
-        return self.sessions[name]
+        return session
 
-    def upsert_session(self, name: str, session_data: str, overwrite: bool = False) -> Session:
+    def upsert_session(
+        self,
+        name: str,
+        session_data: Union[str, Dict[str, Any]],
+        overwrite: bool = False
+    ) -> Session:
         """
         Create a new session and persist it.
         
         Args:
             name: Name of the session
-            session_data: JSON string containing session data (base_url, auth config)
+            session_data: Session data (base_url, auth config) as a dict or JSON string
             overwrite: Whether to overwrite an existing session
         Returns:
             Session: The created session
             
         Raises:
-            ValueError: If a session with the given name already exists
+            ValueError: If a session with the given name already exists, or
+                its auth configuration is invalid
         """
         if not overwrite and name in self.sessions:
             raise ValueError(f"Session '{name}' already exists")
             
-        # Parse session data
-        data = json.loads(session_data)
+        # Parse session data unless the caller already has it as a dict
+        data = serialization.loads(session_data) if isinstance(session_data, str) else session_data
         session = Session.from_dict(name, data)
         
+        # Build the authenticator now, so invalid auth settings are rejected
+        # before anything is saved
+        session.authenticator
+        
         # Store and persist
         self.sessions[name] = session
         self._save_sessions()
         return session
 
+    def rename_session(self, name: str, new_name: str) -> Session:
+        """
+        Rename a session without rebuilding it.
+        
+        Args:
+            name: Current name of the session
+            new_name: New name for the session
+            
+        Returns:
+            Session: The renamed session
+            
+        Raises:
+            ValueError: If the session does not exist or the new name is taken
+        """
+        session = self.get_session(name)
+        if new_name != name and new_name in self.sessions:
+            raise ValueError(f"Session '{new_name}' already exists")
+            
+        del self.sessions[name]
+        session.name = new_name
+        self.sessions[new_name] = session
+        self._save_sessions()
+        return session
+
+    def set_base_url(self, name: str, base_url: str) -> Session:
+        """
+        Change the base URL of a session in place.
+        
+        Args:
+            name: Name of the session
+            base_url: New base URL
+            
+        Returns:
+            Session: The updated session
+            
+        Raises:
+            ValueError: If the session does not exist
+        """
+        session = self.get_session(name)
+        session.base_url = base_url
+        self._save_sessions()
+        return session
+
     def list_sessions(self) -> Dict[str, Session]:
         """Get all available sessions."""
         return self.sessions
 
+    def available_swagger_specs(self) -> Set[str]:
+        """
+        Get the Swagger spec paths of all sessions that exist on disk.
+        
+        Each directory holding specs is scanned once, instead of checking
+        every session's spec file separately.
+        
+        Returns:
+            Set[str]: Spec paths, as stored on the sessions, whose files exist
+        """
+        spec_paths = {
+            session.swagger_spec_path
+            for session in self.sessions.values()
+            if session.swagger_spec_path
+        }
+        
+        entries: Dict[str, Set[str]] = {}
+        available = set()
+        for spec_path in spec_paths:
+            directory, filename = os.path.split(spec_path)
+            names = entries.get(directory)
+            if names is None:
+                try:
+                    with os.scandir(directory or '.') as it:
+                        names = {entry.name for entry in it if entry.is_file()}
+                except OSError:
+                    names = set()
+                entries[directory] = names
+            if filename in names:
+                available.add(spec_path)
+        return available
+
     def delete_session(self, name: str) -> None:
         """
         Delete a session.
@@ -76,26 +175,104 @@ class SessionStore:
         del self.sessions[name]
         self._save_sessions()
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group several mutations into a single write to disk.
+        
+        Saves requested inside the block are deferred until the outermost
+        batch exits, which then writes the sessions file once.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._save_pending:
+                self._save_pending = False
+                self._save_sessions()
+
     def _load_sessions(self) -> None:
         """Load sessions from disk."""
         if not os.path.exists(self.sessions_file):
             return
             
         try:
-            with open(self.sessions_file, 'r') as f:
-                data = json.load(f)
+            with open(self.sessions_file, 'rb') as f:
+                data = serialization.loads(f.read())
                 for name, session_data in data.items():
                     self.sessions[name] = Session.from_dict(name, session_data)
-        except Exception as e:
-            # If file is corrupted, start with empty sessions
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            # If file is corrupted, move it aside so the next save cannot
+            # replace it, then start with empty sessions
+            corrupt_file = f"{self.sessions_file}.corrupt"
+            try:
+                os.replace(self.sessions_file, corrupt_file)
+            except OSError as move_error:
+                logger.warning("Could not move unreadable sessions file aside: %s", move_error)
+            logger.warning("Ignoring unreadable sessions file %s (kept as %s): %s", self.sessions_file, corrupt_file, e)
             self.sessions = {}
 
+    def _encode_sessions(self) -> bytes:
+        """
+        Encode all sessions as a JSON document.
+        
+        In compact mode each session is encoded on its own and reused until
+        its to_dict result changes, so a save only re-encodes the sessions
+        that were modified since the last one.
+        
+        Returns:
+            bytes: The sessions file contents
+        """
+        if self.pretty:
+            data = {name: session.to_dict() for name, session in self.sessions.items()}
+            return serialization.dumps_bytes(data, indent=True)
+            
+        fragments: Dict[str, Tuple[Dict[str, Any], bytes]] = {}
+        for name, session in self.sessions.items():
+            session_dict = session.to_dict()
+            cached = self._fragments.get(name)
+            if cached is None or cached[0] is not session_dict:
+                cached = (session_dict, serialization.dumps_bytes(session_dict))
+            fragments[name] = cached
+        self._fragments = fragments
+        
+        return b'{' + b','.join(
+            serialization.dumps_bytes(name) + b':' + encoded
+            for name, (_, encoded) in fragments.items()
+        ) + b'}'
+
     def _save_sessions(self) -> None:
-        """Save sessions to disk."""
-        data = {
-            name: session.to_dict()
-            for name, session in self.sessions.items()
-        }
+        """Save sessions to disk, or defer the save while a batch is open."""
+        if self._batch_depth:
+            self._save_pending = True
+            return
+            
+        payload = self._encode_sessions()
         
-        with open(self.sessions_file, 'w') as f:
-            json.dump(data, f, indent=2)
\ No newline at end of file
+        # Write a sibling temp file and swap it in, so a crash mid-write never
+        # leaves a truncated sessions file behind
+        fd, tmp_path = tempfile.mkstemp(prefix='.sessions.', dir=os.path.dirname(self.sessions_file))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.sessions_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+@lru_cache(maxsize=1)
+def get_default_session_store() -> SessionStore:
+    """
+    Get the process-wide session store backed by the default sessions file.
+    
+    The store is created on first use, so the sessions file is read at most
+    once per process and only by commands that need it.
+    
+    Returns:
+        SessionStore: Shared session store instance
+    """
+    return SessionStore()
@@ -1,9 +1,142 @@
 """Base class for Swagger client functionality."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Any, Pattern, Tuple
 import re
 
+if TYPE_CHECKING:
+    from ..schema import SwaggerEndpoint, SwaggerEndpointParameter
+
+# Matches a `{name}` placeholder in a spec path
+_PATH_PARAM_RE = re.compile(r'{([^}]+)}')
+
+
+@lru_cache(maxsize=1024)
+def _compile_spec_path(spec_path: str) -> Pattern[str]:
+    """Compile a spec path such as /pet/{petId} into a regex with named groups."""
+    pattern = spec_path.replace('{', '(?P<').replace('}', '>[^/]+)')
+    return re.compile(f'^{pattern}$')
+
+
+@lru_cache(maxsize=1024)
+def _extract_path_params(spec_path: str) -> Tuple[str, ...]:
+    """Get the parameter names of a spec path, in order."""
+    return tuple(_PATH_PARAM_RE.findall(spec_path))
+
+
+# Sample values for primitive schema types, and for string formats
+PRIMITIVE_SAMPLES: Dict[str, Any] = {'string': "string", 'integer': 0, 'number': 0, 'boolean': False}
+FORMAT_SAMPLES: Dict[str, str] = {'date-time': "2023-01-01T00:00:00Z", 'date': "2023-01-01"}
+
+
+def _copy_sample(value: Any) -> Any:
+    """Copy a generated sample, which only holds dicts, lists and scalars."""
+    if isinstance(value, dict):
+        return {key: _copy_sample(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_sample(item) for item in value]
+    return value
+
+
+class _EndpointMeta:
+    """
+    Data derived from one endpoint, built on first use and kept per client.
+    
+    Holds the endpoint's parameters grouped by location and by (location,
+    name), and its get_endpoint_details template once that is first needed.
+    """
+    
+    __slots__ = ('by_location', 'by_name', 'details')
+    
+    def __init__(self, parameters: List['SwaggerEndpointParameter']) -> None:
+        self.by_location: Dict[str, List['SwaggerEndpointParameter']] = {}
+        self.by_name: Dict[Tuple[str, str], 'SwaggerEndpointParameter'] = {}
+        self.details: Optional[Dict[str, Any]] = None
+        for param in parameters:
+            self.by_location.setdefault(param.in_location, []).append(param)
+            self.by_name.setdefault((param.in_location, param.name), param)
+
+
+class _PathTrie:
+    """
+    Spec paths indexed segment by segment for matching request paths.
+    
+    Literal segments are looked up in a dict. A segment that is a single
+    placeholder such as {petId} binds any non-empty segment without touching
+    the regex engine; only mixed segments like {name}.json use a compiled
+    pattern. Each leaf maps an upper-cased HTTP method to the first endpoint
+    declared for it, along with that endpoint's position in the spec.
+    """
+    
+    __slots__ = ('literals', 'wildcards', 'params', 'methods')
+    
+    def __init__(self) -> None:
+        self.literals: Dict[str, '_PathTrie'] = {}
+        self.wildcards: Dict[str, '_PathTrie'] = {}
+        self.params: Dict[Tuple[str, Tuple[str, ...]], Tuple[Pattern[str], '_PathTrie']] = {}
+        self.methods: Dict[str, Tuple[int, 'SwaggerEndpoint']] = {}
+        
+    def insert(self, index: int, endpoint: 'SwaggerEndpoint') -> None:
+        """Add an endpoint, keeping the first one declared for each path and method."""
+        node = self
+        for segment in endpoint.path.split('/'):
+            names = _PATH_PARAM_RE.findall(segment)
+            if not names:
+                node = node.literals.setdefault(segment, _PathTrie())
+            elif len(names) == 1 and segment == f'{{{names[0]}}}':
+                node = node.wildcards.setdefault(names[0], _PathTrie())
+            else:
+                pattern = '^' + ''.join(
+                    '([^/]+)' if i % 2 else re.escape(part)
+                    for i, part in enumerate(_PATH_PARAM_RE.split(segment))
+                ) + '$'
+                key = (pattern, tuple(names))
+                if key not in node.params:
+                    node.params[key] = (re.compile(pattern), _PathTrie())
+                node = node.params[key][1]
+        node.methods.setdefault(endpoint.method.upper(), (index, endpoint))
+        
+    def match(
+        self, segments: List[str], depth: int, method: str, params: Dict[str, str]
+    ) -> Optional[Tuple[int, 'SwaggerEndpoint', Dict[str, str]]]:
+        """
+        Find the earliest declared endpoint matching the remaining segments.
+        
+        Args:
+            segments: Request path split on '/'
+            depth: Index of the segment to match at this node
+            method: Upper-cased HTTP method
+            params: Path parameters bound so far
+            
+        Returns:
+            Tuple of (spec position, endpoint, path params) or None if nothing matches
+        """
+        if depth == len(segments):
+            found = self.methods.get(method)
+            return (found[0], found[1], params) if found else None
+            
+        segment = segments[depth]
+        best = None
+        child = self.literals.get(segment)
+        if child is not None:
+            best = child.match(segments, depth + 1, method, params)
+            
+        candidates = []
+        if segment:
+            for name, child in self.wildcards.items():
+                candidates.append(child.match(segments, depth + 1, method, {**params, name: segment}))
+        for (_, names), (compiled, child) in self.params.items():
+            match = compiled.match(segment)
+            if match is not None:
+                candidates.append(child.match(segments, depth + 1, method, {**params, **dict(zip(names, match.groups()))}))
+                
+        for candidate in candidates:
+            if candidate is not None and (best is None or candidate[0] < best[0]):
+                best = candidate
+        return best
+
+
 class SwaggerClient(ABC):
     """
     Abstract base class for Swagger clients.
@@ -13,6 +146,26 @@ class SwaggerClient(ABC):
     should inherit from this class and implement its methods.
     """
     
+    # Prefix of $refs that point into _schemas, set by each client
+    _ref_prefix: str = ''
+    # Named schemas that $refs resolve to, set by each client
+    _schemas: Dict[str, Any]
+    
+    # Built on first lookup; clients are read-only so it never goes stale
+    _path_trie: Optional[_PathTrie] = None
+    # Derived data per endpoint, keyed by id() of the spec's endpoint
+    _endpoint_meta: Optional[Dict[int, _EndpointMeta]] = None
+    # Generated request, response and header samples, see _cached_sample
+    _samples: Optional[Dict[Tuple[Any, ...], Any]] = None
+    # Endpoint summaries, all of them under None and per upper-cased method
+    _endpoint_summaries: Optional[Dict[Optional[str], List[Dict[str, Any]]]] = None
+    # Samples generated per referenced schema name, see _ref_sample
+    _ref_samples: Optional[Dict[str, Any]] = None
+    # Referenced schemas being generated, outermost first
+    _ref_building: Optional[List[str]] = None
+    # Shallowest entry of _ref_building that a reference cycle led back to
+    _ref_cycle_depth: Optional[int] = None
+    
     @property
     @abstractmethod
     def api_title(self) -> str:
@@ -128,6 +281,210 @@ class SwaggerClient(ABC):
         """
         pass
 
+    def _find_endpoint(self, path: str, method: str) -> Tuple[Optional['SwaggerEndpoint'], Dict[str, str]]:
+        """
+        Find the endpoint serving a request path and method.
+        
+        When several spec paths match, the one declared first wins, as with a
+        linear scan over the endpoints.
+        
+        Args:
+            path: Actual request path (e.g. /pet/123)
+            method: The HTTP method
+            
+        Returns:
+            Tuple of (endpoint, path_params), with endpoint None if nothing matches
+        """
+        trie = self._path_trie
+        if trie is None:
+            trie = _PathTrie()
+            for index, endpoint in enumerate(self._spec.endpoints):
+                trie.insert(index, endpoint)
+            self._path_trie = trie
+            
+        found = trie.match(path.split('/'), 0, method.upper(), {})
+        if found is None:
+            return None, {}
+        return found[1], found[2]
+
+    @abstractmethod
+    def _build_endpoint_details(self, endpoint: 'SwaggerEndpoint') -> Dict[str, Any]:
+        """
+        Describe an endpoint for get_endpoint_details.
+        
+        Args:
+            endpoint: Endpoint from this client's specification
+            
+        Returns:
+            Endpoint details, without path_params
+        """
+        pass
+        
+    def _endpoint_details(self, endpoint: 'SwaggerEndpoint', path_params: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Get an endpoint's details for one request path.
+        
+        The description is built once per endpoint; each call gets a new
+        top-level dict holding its own path_params, while nested values such
+        as the parameter list are shared and must not be mutated.
+        
+        Args:
+            endpoint: Endpoint from this client's specification
+            path_params: Path parameters bound from the request path
+            
+        Returns:
+            Endpoint details including path_params
+        """
+        meta = self._meta(endpoint)
+        if meta.details is None:
+            meta.details = self._build_endpoint_details(endpoint)
+        return {**meta.details, 'path_params': path_params}
+
+    def _list_endpoints(self, method: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get endpoint summaries, optionally for one HTTP method only.
+        
+        Summaries are built once per client and bucketed by method; the
+        returned list is new but the dictionaries in it are shared.
+        
+        Args:
+            method: Optional HTTP method to filter by (GET, POST, etc.)
+            
+        Returns:
+            List of endpoint summary dictionaries in specification order
+        """
+        summaries = self._endpoint_summaries
+        if summaries is None:
+            summaries = {None: []}
+            for endpoint in self._spec.endpoints:
+                endpoint_method = endpoint.method.upper()
+                summary = {
+                    'path': endpoint.path,
+                    'method': endpoint_method,
+                    'summary': endpoint.summary,
+                    'description': endpoint.description,
+                    'operation_id': endpoint.operation_id
+                }
+                summaries[None].append(summary)
+                summaries.setdefault(endpoint_method, []).append(summary)
+            self._endpoint_summaries = summaries
+            
+        return list(summaries.get(method.upper() if method else None, ()))
+
+    def _params_in(self, endpoint: 'SwaggerEndpoint', location: str) -> List['SwaggerEndpointParameter']:
+        """
+        Get an endpoint's parameters in one location, grouped once per endpoint.
+        
+        Args:
+            endpoint: Endpoint from this client's specification
+            location: Parameter location (path, query, header, body, ...)
+            
+        Returns:
+            Parameters in that location, in declaration order; must not be mutated
+        """
+        return self._meta(endpoint).by_location.get(location, [])
+        
+    def _param_named(
+        self, endpoint: 'SwaggerEndpoint', location: str, name: str
+    ) -> Optional['SwaggerEndpointParameter']:
+        """
+        Get the first parameter of an endpoint with the given location and name.
+        
+        Args:
+            endpoint: Endpoint from this client's specification
+            location: Parameter location (path, query, header, body, ...)
+            name: Parameter name
+            
+        Returns:
+            The parameter or None if the endpoint does not declare it
+        """
+        return self._meta(endpoint).by_name.get((location, name))
+        
+    def _meta(self, endpoint: 'SwaggerEndpoint') -> _EndpointMeta:
+        """Get the derived data for an endpoint, creating it on first use."""
+        cache = self._endpoint_meta
+        if cache is None:
+            cache = self._endpoint_meta = {}
+        # The spec keeps its endpoints alive, so their ids stay unique
+        meta = cache.get(id(endpoint))
+        if meta is None:
+            meta = cache[id(endpoint)] = _EndpointMeta(endpoint.parameters)
+        return meta
+
+    def _cached_sample(self, key: Tuple[Any, ...], build: Callable[[], Any]) -> Any:
+        """
+        Get a generated sample, building it on the first request for its key.
+        
+        Samples only depend on the specification, which never changes for a
+        client, so they are never invalidated. Callers get their own copy.
+        
+        Args:
+            key: Kind of sample plus the endpoint's id() and any other inputs
+            build: Generates the sample on a cache miss
+            
+        Returns:
+            Sample data
+        """
+        samples = self._samples
+        if samples is None:
+            samples = self._samples = {}
+        if key not in samples:
+            samples[key] = build()
+        return _copy_sample(samples[key])
+
+    def _ref_sample(self, name: str, build: Callable[[], Any]) -> Any:
+        """
+        Get the sample for a referenced schema, generating it once per client.
+        
+        Callers get their own copy, so cached samples are never shared with
+        the caller. A schema that refers back to itself gets an empty object
+        at the point where it recurses. When schemas refer to each other in a
+        cycle, where the cycle is cut depends on which of them was entered
+        first, so their samples are regenerated on every call instead of
+        being cached.
+        
+        Args:
+            name: Name of the referenced schema
+            build: Generates the sample on a cache miss
+            
+        Returns:
+            Sample data for the schema
+        """
+        samples = self._ref_samples
+        if samples is None:
+            samples = self._ref_samples = {}
+            self._ref_building = []
+        if name in samples:
+            return _copy_sample(samples[name])
+        
+        building = self._ref_building
+        if name in building:
+            depth = building.index(name)
+            # Everything from `name` inward now depends on where the cycle
+            # was entered; a direct self-reference does not
+            if depth < len(building) - 1 and (self._ref_cycle_depth is None or depth < self._ref_cycle_depth):
+                self._ref_cycle_depth = depth
+            return {}
+        
+        depth = len(building)
+        building.append(name)
+        try:
+            sample = build()
+        except Exception:
+            # Do not let a failed build keep later samples out of the cache
+            if depth == 0:
+                self._ref_cycle_depth = None
+            raise
+        finally:
+            building.pop()
+        
+        if self._ref_cycle_depth is None:
+            samples[name] = sample
+        elif self._ref_cycle_depth == depth:
+            # Schemas outside the cycle are unaffected by it
+            self._ref_cycle_depth = None
+        return _copy_sample(sample)
+
     def _match_path_with_params(self, spec_path: str, request_path: str) -> Tuple[bool, Dict[str, str]]:
         """
         Match a request path against a spec path with parameters.
@@ -139,9 +496,8 @@ class SwaggerClient(ABC):
         Returns:
             Tuple of (is_match, path_params) where path_params is a dict of parameter name to value
         """
-        # Convert spec path to regex pattern
-        pattern = spec_path.replace('{', '(?P<').replace('}', '>[^/]+)')
-        match = re.match(f'^{pattern}$', request_path)
+        # Spec paths are compiled once and reused across lookups
+        match = _compile_spec_path(spec_path).match(request_path)
         
         if not match:
             return False, {}
@@ -158,7 +514,7 @@ class SwaggerClient(ABC):
         Returns:
             List of parameter names
         """
-        return re.findall(r'{([^}]+)}', spec_path)
+        return list(_extract_path_params(spec_path))
         
     def _replace_path_params(self, spec_path: str, params: Dict[str, str]) -> str:
         """
@@ -171,7 +527,74 @@ class SwaggerClient(ABC):
         Returns:
             Path with parameters replaced
         """
-        result = spec_path
-        for name, value in params.items():
-            result = result.replace(f'{{{name}}}', value)
-        return result 
\ No newline at end of file
+        # Single pass over the path; unknown placeholders are left as they are
+        return _PATH_PARAM_RE.sub(lambda match: params.get(match.group(1), match.group(0)), spec_path) 
+
+    def _generate_sample_from_schema(self, schema: Dict[str, Any]) -> Any:
+        """
+        Generate a sample object from a JSON Schema.
+        
+        Args:
+            schema: JSON Schema
+            
+        Returns:
+            Sample data based on the schema
+        """
+        # Handle $ref (simple implementation - would need to be expanded)
+        if '$ref' in schema:
+            return self._sample_for_ref(schema['$ref'])
+            
+        schema_type = schema.get('type')
+        
+        # Handle array
+        if schema_type == 'array' and 'items' in schema:
+            items_schema = schema['items']
+            return [self._generate_sample_from_schema(items_schema)]
+            
+        # Handle object
+        if schema_type == 'object' or 'properties' in schema:
+            result = {}
+            properties = schema.get('properties', {})
+            
+            for prop_name, prop_schema in properties.items():
+                result[prop_name] = self._generate_value_for_property(prop_schema)
+                
+            return result
+            
+        # Handle primitives
+        if schema_type == 'string':
+            enum = schema.get('enum')
+            return enum[0] if enum else FORMAT_SAMPLES.get(schema.get('format'), "string")
+        if schema_type in PRIMITIVE_SAMPLES:
+            return PRIMITIVE_SAMPLES[schema_type]
+        
+        # Default
+        return {}
+    
+    def _sample_for_ref(self, ref_path: str) -> Any:
+        """
+        Generate the sample for a $ref to one of this specification's schemas.
+        
+        Args:
+            ref_path: Reference such as #/components/schemas/Pet
+            
+        Returns:
+            Sample data for the referenced schema, or {} for other references
+        """
+        if not ref_path.startswith(self._ref_prefix):
+            return {}
+        name = ref_path.rpartition('/')[2]
+        return self._ref_sample(name, lambda: self._generate_sample_from_schema(self._schemas.get(name, {})))
+    
+    def _generate_value_for_property(self, prop_schema: Dict[str, Any]) -> Any:
+        """Generate a sample value for a property."""
+        # Delegate to _generate_sample_from_schema
+        return self._generate_sample_from_schema(prop_schema)
+        
+    def _generate_sample_value(self, param: Any) -> Any:
+        """Generate a sample value for a parameter."""
+        if param.enum and param.enum[0]:
+            return param.enum[0]
+        elif param.default is not None:
+            return param.default
+        return PRIMITIVE_SAMPLES.get(param.type)
@@ -1,100 +1,128 @@
 """Factory for creating Swagger clients."""
 
+from functools import lru_cache
 from typing import Optional
 import os
 import json
 import logging
 
-from ..schema import SwaggerSpec, SwaggerSpecType, SwaggerEndpoint, SwaggerEndpointParameter
-from ..parser import SwaggerParser, SwaggerParserError
+from pydantic import ValidationError
+
+from ... import serialization
+
+from ..schema import SwaggerSpec, SwaggerSpecType
+from ..parser import SwaggerParser, SwaggerParserError, SAVED_SPEC_MARKER
 
 from .base import SwaggerClient
 from .swagger2 import Swagger2Client
 from .openapi3 import OpenAPI3Client
 
+logger = logging.getLogger(__name__)
+
+# How the marker key appears in a saved spec's JSON
+_SAVED_SPEC_KEY = f'"{SAVED_SPEC_MARKER}"'.encode()
+
 
 class SwaggerClientFactory:
     """Factory for creating Swagger clients."""
     
+    # Shared by every load; only parse_from_dict is used, which keeps no state
+    _parser: Optional[SwaggerParser] = None
+    
+    @classmethod
+    def _get_parser(cls) -> SwaggerParser:
+        """Get the parser shared by all factory loads, creating it on first use."""
+        if cls._parser is None:
+            cls._parser = SwaggerParser()
+        return cls._parser
+    
     @staticmethod
     def create_from_file(file_path: str) -> Optional[SwaggerClient]:
         """
         Create a Swagger client from a specification file.
         
+        Clients are read-only, so one client is shared by every caller that
+        asks for the same unchanged file within a process.
+        
         Args:
             file_path: Path to the Swagger/OpenAPI specification file
             
         Returns:
             SwaggerClient: Appropriate client for the specification version
         """
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
             return None
+            
+        # Resolve the path so every spelling of the same file shares a cache entry
+        return SwaggerClientFactory._create_from_file_cached(
+            os.path.realpath(file_path), stat.st_mtime_ns, stat.st_size
+        )
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop every cached client, forcing the next request to reload its file."""
+        SwaggerClientFactory._create_from_file_cached.cache_clear()
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _create_from_file_cached(file_path: str, mtime_ns: int, size: int) -> Optional[SwaggerClient]:
+        """
+        Create a Swagger client for a specific version of a specification file.
+        
+        Args:
+            file_path: Path to the Swagger/OpenAPI specification file
+            mtime_ns: Modification time of the file, part of the cache key
+            size: Size of the file, part of the cache key
+            
+        Returns:
+            SwaggerClient: Appropriate client for the specification version
+        """
+        logger.debug("Creating Swagger client from file: %s", file_path)
         
-        logging.debug(f"Creating Swagger client from file: {file_path}")
+        # Prefer the pickled spec, which skips JSON decoding and revalidation
+        cached_spec = SwaggerParser.load_cached_spec(file_path)
+        if cached_spec is not None:
+            logger.debug("Loaded cached SwaggerSpec: %s v%s", cached_spec.title, cached_spec.version)
+            return SwaggerClientFactory.create_from_spec(cached_spec)
             
         try:
-            # First try to load as a serialized SwaggerSpec JSON file
-            with open(file_path, 'r') as f:
-                spec_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                raw = f.read()
                 
-            # Check if this looks like a serialized SwaggerSpec
-            if all(key in spec_data for key in ('spec_type', 'title', 'version')):
-                # It's likely a serialized SwaggerSpec
-                logging.debug("File appears to be a serialized SwaggerSpec, attempting to load")
+            # Saved specs carry a marker key, older saves a spec_type key. A byte
+            # search spots them without decoding, and pydantic then parses and
+            # validates the JSON in one pass with no intermediate dict.
+            if _SAVED_SPEC_KEY in raw or b'"spec_type"' in raw:
+                logger.debug("File appears to be a serialized SwaggerSpec, attempting to load")
                 try:
-                    # Use model_validate (Pydantic v2)
-                    swagger_spec = SwaggerSpec.model_validate(spec_data)
-                    logging.debug(f"Successfully loaded serialized SwaggerSpec: {swagger_spec.title} v{swagger_spec.version}")
+                    swagger_spec = SwaggerSpec.model_validate_json(raw)
+                    logger.debug("Successfully loaded serialized SwaggerSpec: %s v%s", swagger_spec.title, swagger_spec.version)
+                    SwaggerParser.write_spec_cache(swagger_spec, file_path)
                     return SwaggerClientFactory.create_from_spec(swagger_spec)
-                except Exception as e:
-                    logging.warning(f"Error deserializing SwaggerSpec: {e}")
-                    
-                    # Alternative approach: try manual reconstruction
-                    try:
-                        logging.debug("Attempting manual reconstruction of SwaggerSpec")
-                        # Manual reconstruction of the object
-                        if isinstance(spec_data['spec_type'], str):
-                            spec_data['spec_type'] = SwaggerSpecType(spec_data['spec_type'])
-                            
-                        # Create endpoints with proper model instances
-                        endpoints = []
-                        for ep_data in spec_data.get('endpoints', []):
-                            # Create parameter objects
-                            parameters = []
-                            for param_data in ep_data.get('parameters', []):
-                                parameters.append(SwaggerEndpointParameter(**param_data))
-                                
-                            # Create endpoint with parameters
-                            ep_data['parameters'] = parameters
-                            endpoints.append(SwaggerEndpoint(**ep_data))
-                            
-                        # Update spec data
-                        spec_data['endpoints'] = endpoints
-                        
-                        # Create the spec
-                        swagger_spec = SwaggerSpec(**spec_data)
-                        logging.debug(f"Manual reconstruction successful: {swagger_spec.title} v{swagger_spec.version}")
-                        return SwaggerClientFactory.create_from_spec(swagger_spec)
-                    except Exception as e2:
-                        logging.warning(f"Manual reconstruction failed: {e2}")
-                        # Continue to try parsing as raw spec
+                except ValidationError as e:
+                    # Fall through to parsing as a raw spec
+                    logger.warning("Error deserializing SwaggerSpec: %s", e)
             
             # If we get here, it's not a serialized SwaggerSpec or deserialization failed
-            # Fall back to parsing as a raw Swagger/OpenAPI spec
-            logging.debug("Attempting to parse file as raw Swagger/OpenAPI spec")
-            parser = SwaggerParser()
-            spec = parser.parse(file_path)
-            logging.debug(f"Successfully parsed raw spec: {spec.title} v{spec.version}")
+            # Fall back to parsing as a raw Swagger/OpenAPI spec, reusing the
+            # bytes read above instead of reading the file again
+            logger.debug("Attempting to parse file as raw Swagger/OpenAPI spec")
+            parser = SwaggerClientFactory._get_parser()
+            spec = parser.parse_from_dict(serialization.loads(raw), file_path)
+            logger.debug("Successfully parsed raw spec: %s v%s", spec.title, spec.version)
+            SwaggerParser.write_spec_cache(spec, file_path)
             return SwaggerClientFactory.create_from_spec(spec)
             
         except SwaggerParserError as e:
-            logging.error(f"Error parsing Swagger specification: {e}")
+            logger.error("Error parsing Swagger specification: %s", e)
             return None
         except json.JSONDecodeError as e:
-            logging.error(f"Invalid JSON in file: {e}")
+            logger.error("Invalid JSON in file: %s", e)
             return None
         except Exception as e:
-            logging.error(f"Error creating Swagger client: {e}")
+            logger.error("Error creating Swagger client: %s", e)
             return None
     
     @staticmethod
@@ -113,15 +141,15 @@ class SwaggerClientFactory:
             
             if spec.spec_type == SwaggerSpecType.SWAGGER_2:
                 client = Swagger2Client(spec)
-                logging.debug(f"Created Swagger 2.0 client for {spec.title}")
+                logger.debug("Created Swagger 2.0 client for %s", spec.title)
             elif spec.spec_type == SwaggerSpecType.OPENAPI_3:
                 client = OpenAPI3Client(spec)
-                logging.debug(f"Created OpenAPI 3.0 client for {spec.title}")
+                logger.debug("Created OpenAPI 3.0 client for %s", spec.title)
             else:
-                logging.warning(f"Unsupported spec type: {spec.spec_type}")
+                logger.warning("Unsupported spec type: %s", spec.spec_type)
                 return None
                 
             return client
         except Exception as e:
-            logging.error(f"Error creating client from spec: {e}")
+            logger.error("Error creating client from spec: %s", e)
             return None 
\ No newline at end of file
@@ -10,6 +10,8 @@ from .base import SwaggerClient
 class OpenAPI3Client(SwaggerClient):
     """Client for OpenAPI 3.0 specifications."""
     
+    _ref_prefix = '#/components/schemas/'
+    
     def __init__(self, swagger_spec: SwaggerSpec):
         """
         Initialize the OpenAPI 3.0 client.
@@ -21,6 +23,8 @@ class OpenAPI3Client(SwaggerClient):
             raise ValueError(f"Expected OpenAPI 3.0 spec, got {swagger_spec.spec_type}")
         
         self._spec = swagger_spec
+        # Component schemas, the target of every $ref
+        self._schemas: Dict[str, Any] = swagger_spec.components.get('schemas', {})
         
     @property
     def api_title(self) -> str:
@@ -39,40 +43,20 @@ class OpenAPI3Client(SwaggerClient):
         
     def get_available_endpoints(self, method: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get a list of available endpoints."""
-        result = []
-        
-        for endpoint in self._spec.endpoints:
-            # Filter by method if specified
-            if method and endpoint.method.upper() != method.upper():
-                continue
-                
-            result.append({
-                'path': endpoint.path,
-                'method': endpoint.method.upper(),
-                'summary': endpoint.summary,
-                'description': endpoint.description,
-                'operation_id': endpoint.operation_id
-            })
-            
-        return result
+        return self._list_endpoints(method)
     
     def get_endpoint_details(self, path: str, method: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific endpoint."""
         # Find matching endpoint
-        endpoint_match = None
-        path_params = {}
+        endpoint_match, path_params = self._find_endpoint(path, method)
         
-        for endpoint in self._spec.endpoints:
-            if endpoint.method.upper() == method.upper():
-                is_match, params = self._match_path_with_params(endpoint.path, path)
-                if is_match:
-                    endpoint_match = endpoint
-                    path_params = params
-                    break
-                
         if not endpoint_match:
             return None
             
+        return self._endpoint_details(endpoint_match, path_params)
+        
+    def _build_endpoint_details(self, endpoint_match: SwaggerEndpoint) -> Dict[str, Any]:
+        """Describe an endpoint, without the request's path parameters."""
         return {
             'path': endpoint_match.path,
             'method': endpoint_match.method.upper(),
@@ -91,27 +75,21 @@ class OpenAPI3Client(SwaggerClient):
             ],
             'request_body': endpoint_match.request_body,
             'responses': endpoint_match.responses,
-            'tags': endpoint_match.tags,
-            'path_params': path_params
+            'tags': endpoint_match.tags
         }
         
     def get_request_sample(self, path: str, method: str) -> Optional[Dict[str, Any]]:
         """Generate a sample request body for the specified endpoint."""
         # Find matching endpoint
-        endpoint_match = None
-        path_params = {}
+        endpoint_match, _ = self._find_endpoint(path, method)
         
-        for endpoint in self._spec.endpoints:
-            if endpoint.method.upper() == method.upper():
-                is_match, params = self._match_path_with_params(endpoint.path, path)
-                if is_match:
-                    endpoint_match = endpoint
-                    path_params = params
-                    break
-                
         if not endpoint_match:
             return None
             
+        return self._cached_sample(('request', id(endpoint_match)), lambda: self._build_request_sample(endpoint_match))
+        
+    def _build_request_sample(self, endpoint_match: SwaggerEndpoint) -> Optional[Dict[str, Any]]:
+        """Generate a sample request body for an endpoint."""
         # Generate sample data
         sample_data = {}
         
@@ -131,18 +109,18 @@ class OpenAPI3Client(SwaggerClient):
     def get_response_sample(self, path: str, method: str, status_code: str = "200") -> Optional[Dict[str, Any]]:
         """Generate a sample response for the specified endpoint."""
         # Find matching endpoint
-        endpoint_match = None
+        endpoint_match, _ = self._find_endpoint(path, method)
         
-        for endpoint in self._spec.endpoints:
-            if endpoint.method.upper() == method.upper():
-                is_match, _ = self._match_path_with_params(endpoint.path, path)
-                if is_match:
-                    endpoint_match = endpoint
-                    break
-                
         if not endpoint_match:
             return None
             
+        return self._cached_sample(
+            ('response', id(endpoint_match), status_code),
+            lambda: self._build_response_sample(endpoint_match, status_code)
+        )
+        
+    def _build_response_sample(self, endpoint_match: SwaggerEndpoint, status_code: str) -> Optional[Dict[str, Any]]:
+        """Generate a sample response for an endpoint and status code."""
         response = endpoint_match.responses.get(status_code, {})
         content = response.get('content', {})
         for content_type, content_obj in content.items():
@@ -155,23 +133,20 @@ class OpenAPI3Client(SwaggerClient):
         
     def get_header_samples(self, path: str, method: str) -> Dict[str, str]:
         """Get sample headers for the specified endpoint."""
-        headers: Dict[str, str] = {}
-        
         # Find matching endpoint
-        endpoint_match = None
+        endpoint_match, _ = self._find_endpoint(path, method)
         
-        for endpoint in self._spec.endpoints:
-            if endpoint.method.upper() == method.upper():
-                is_match, _ = self._match_path_with_params(endpoint.path, path)
-                if is_match:
-                    endpoint_match = endpoint
-                    break
-                
         if not endpoint_match:
-            return headers
+            return {}
             
+        return self._cached_sample(('headers', id(endpoint_match)), lambda: self._build_header_samples(endpoint_match))
+        
+    def _build_header_samples(self, endpoint_match: SwaggerEndpoint) -> Dict[str, str]:
+        """Get sample headers for an endpoint."""
+        headers: Dict[str, str] = {}
+        
         # Check header parameters
-        header_params = [p for p in endpoint_match.parameters if p.in_location == 'header']
+        header_params = self._params_in(endpoint_match, 'header')
         
         for param in header_params:
             sample_value = "sample_value"
@@ -201,17 +176,8 @@ class OpenAPI3Client(SwaggerClient):
         errors = []
         
         # Find matching endpoint
-        endpoint_match = None
-        path_params = {}
+        endpoint_match, path_params = self._find_endpoint(path, method)
         
-        for endpoint in self._spec.endpoints:
-            if endpoint.method.upper() == method.upper():
-                is_match, params = self._match_path_with_params(endpoint.path, path)
-                if is_match:
-                    endpoint_match = endpoint
-                    path_params = params
-                    break
-                
         if not endpoint_match:
             return False, ["Endpoint not found in specification"]
             
@@ -222,7 +188,7 @@ class OpenAPI3Client(SwaggerClient):
                 errors.append(f"Missing required path parameter: {param_name}")
             else:
                 # Find the parameter definition
-                param = next((p for p in endpoint_match.parameters if p.name == param_name and p.in_location == 'path'), None)
+                param = self._param_named(endpoint_match, 'path', param_name)
                 if param:
                     # Validate the parameter value
                     if param.enum and path_params[param_name] not in param.enum:
@@ -230,7 +196,7 @@ class OpenAPI3Client(SwaggerClient):
             
         # Check required parameters
         if headers:
-            header_params = [p for p in endpoint_match.parameters if p.in_location == 'header']
+            header_params = self._params_in(endpoint_match, 'header')
             for param in header_params:
                 if param.required and param.name not in headers:
                     errors.append(f"Missing required header parameter: {param.name}")
@@ -245,74 +211,3 @@ class OpenAPI3Client(SwaggerClient):
             # For the OpenAPI 3.0 spec, the request body has content with media types
                 
         return len(errors) == 0, errors
-    
-    def _generate_sample_from_schema(self, schema: Dict[str, Any]) -> Any:
-        """
-        Generate a sample object from a JSON Schema.
-        
-        Args:
-            schema: JSON Schema
-            
-        Returns:
-            Sample data based on the schema
-        """
-        # Handle $ref (simple implementation - would need to be expanded)
-        if '$ref' in schema:
-            ref_path = schema['$ref']
-            if ref_path.startswith('#/components/schemas/'):
-                schema_name = ref_path.split('/')[-1]
-                schema_def = self._spec.components.get('schemas', {}).get(schema_name, {})
-                return self._generate_sample_from_schema(schema_def)
-            return {}
-            
-        # Handle array
-        if schema.get('type') == 'array' and 'items' in schema:
-            items_schema = schema['items']
-            return [self._generate_sample_from_schema(items_schema)]
-            
-        # Handle object
-        if schema.get('type') == 'object' or 'properties' in schema:
-            result = {}
-            properties = schema.get('properties', {})
-            
-            for prop_name, prop_schema in properties.items():
-                result[prop_name] = self._generate_value_for_property(prop_schema)
-                
-            return result
-            
-        # Handle primitives
-        if schema.get('type') == 'string':
-            if 'enum' in schema and schema['enum']:
-                return schema['enum'][0]
-            elif schema.get('format') == 'date-time':
-                return "2023-01-01T00:00:00Z"
-            elif schema.get('format') == 'date':
-                return "2023-01-01"
-            return "string"
-        elif schema.get('type') == 'number' or schema.get('type') == 'integer':
-            return 0
-        elif schema.get('type') == 'boolean':
-            return False
-        
-        # Default
-        return {}
-    
-    def _generate_value_for_property(self, prop_schema: Dict[str, Any]) -> Any:
-        """Generate a sample value for a property."""
-        # Delegate to _generate_sample_from_schema
-        return self._generate_sample_from_schema(prop_schema)
-        
-    def _generate_sample_value(self, param: Any) -> Any:
-        """Generate a sample value for a parameter."""
-        if param.enum and param.enum[0]:
-            return param.enum[0]
-        elif param.default is not None:
-            return param.default
-        elif param.type == 'string':
-            return "string"
-        elif param.type == 'integer' or param.type == 'number':
-            return 0
-        elif param.type == 'boolean':
-            return False
-        else:
-            return None 
\ No newline at end of file
@@ -4,12 +4,14 @@ import json
 from typing import Dict, List, Optional, Any, Tuple, cast
 
 from ..schema import SwaggerSpec, SwaggerSpecType, SwaggerEndpoint
-from .base import SwaggerClient
+from .base import SwaggerClient, PRIMITIVE_SAMPLES, FORMAT_SAMPLES
 
 
 class Swagger2Client(SwaggerClient):
     """Client for Swagger 2.0 specifications."""
     
+    _ref_prefix = '#/definitions/'
+    
     def __init__(self, swagger_spec: SwaggerSpec):
         """
         Initialize the Swagger 2.0 client.
@@ -21,6 +23,8 @@ class Swagger2Client(SwaggerClient):
             raise ValueError(f"Expected Swagger 2.0 spec, got {swagger_spec.spec_type}")
         
         self._spec = swagger_spec
+        # Definitions, the target of every $ref
+        self._schemas: Dict[str, Any] = swagger_spec.definitions
         
     @property
     def api_title(self) -> str:
@@ -39,40 +43,20 @@ class Swagger2Client(SwaggerClient):
         
     def get_available_endpoints(self, method: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get a list of available endpoints."""
-        result = []
-        
-        for endpoint in self._spec.endpoints:
-            # Filter by method if specified
-            if method and endpoint.method.upper() != method.upper():
-                continue
-                
-            result.append({
-                'path': endpoint.path,
-                'method': endpoint.method.upper(),
-                'summary': endpoint.summary,
-                'description': endpoint.description,
-                'operation_id': endpoint.operation_id
-            })
-            
-        return result
+        return self._list_endpoints(method)
     
     def get_endpoint_details(self, path: str, method: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific endpoint."""
         # Find matching endpoint
-        endpoint_match = None
-        path_params = {}
+        endpoint_match, path_params = self._find_endpoint(path, method)
         
-        for endpoint in self._spec.endpoints:
-            if endpoint.method.upper() == method.upper():
-                is_match, params = self._match_path_with_params(endpoint.path, path)
-                if is_match:
-                    endpoint_match = endpoint
-                    path_params = params
-                    break
-                
         if not endpoint_match:
             return None
             
+        return self._endpoint_details(endpoint_match, path_params)
+        
+    def _build_endpoint_details(self, endpoint_match: SwaggerEndpoint) -> Dict[str, Any]:
+        """Describe an endpoint, without the request's path parameters."""
         return {
             'path': endpoint_match.path,
             'method': endpoint_match.method.upper(),
@@ -90,27 +74,21 @@ class Swagger2Client(SwaggerClient):
                 for param in endpoint_match.parameters
             ],
             'responses': endpoint_match.responses,
-            'tags': endpoint_match.tags,
-            'path_params': path_params
+            'tags': endpoint_match.tags
         }
         
     def get_request_sample(self, path: str, method: str) -> Optional[Dict[str, Any]]:
         """Generate a sample request body for the specified endpoint."""
         # Find matching endpoint
-        endpoint_match = None
-        path_params = {}
+        endpoint_match, _ = self._find_endpoint(path, method)
         
-        for endpoint in self._spec.endpoints:
-            if endpoint.method.upper() == method.upper():
-                is_match, params = self._match_path_with_params(endpoint.path, path)
-                if is_match:
-                    endpoint_match = endpoint
-                    path_params = params
-                    break
-                
         if not endpoint_match:
             return None
             
+        return self._cached_sample(('request', id(endpoint_match)), lambda: self._build_request_sample(endpoint_match))
+        
+    def _build_request_sample(self, endpoint_match: SwaggerEndpoint) -> Optional[Dict[str, Any]]:
+        """Generate a sample request body for an endpoint."""
         # Generate sample data
         sample_data = {}
         
@@ -123,7 +101,7 @@ class Swagger2Client(SwaggerClient):
                     sample_data = body_sample
                 
         # Add body parameters if present
-        body_params = [p for p in endpoint_match.parameters if p.in_location == 'body']
+        body_params = self._params_in(endpoint_match, 'body')
         if body_params:
             param_schema = body_params[0].param_schema
             if param_schema:
@@ -136,18 +114,18 @@ class Swagger2Client(SwaggerClient):
     def get_response_sample(self, path: str, method: str, status_code: str = "200") -> Optional[Dict[str, Any]]:
         """Generate a sample response for the specified endpoint."""
         # Find matching endpoint
-        endpoint_match = None
+        endpoint_match, _ = self._find_endpoint(path, method)
         
-        for endpoint in self._spec.endpoints:
-            if endpoint.method.upper() == method.upper():
-                is_match, _ = self._match_path_with_params(endpoint.path, path)
-                if is_match:
-                    endpoint_match = endpoint
-                    break
-                
         if not endpoint_match:
             return None
             
+        return self._cached_sample(
+            ('response', id(endpoint_match), status_code),
+            lambda: self._build_response_sample(endpoint_match, status_code)
+        )
+        
+    def _build_response_sample(self, endpoint_match: SwaggerEndpoint, status_code: str) -> Optional[Dict[str, Any]]:
+        """Generate a sample response for an endpoint and status code."""
         response = endpoint_match.responses.get(status_code, {})
         schema = response.get('schema', {})
         if schema:
@@ -157,22 +135,19 @@ class Swagger2Client(SwaggerClient):
         
     def get_header_samples(self, path: str, method: str) -> Dict[str, str]:
         """Get sample headers for the specified endpoint."""
-        headers: Dict[str, str] = {}
-        
         # Find matching endpoint
-        endpoint_match = None
+        endpoint_match, _ = self._find_endpoint(path, method)
         
-        for endpoint in self._spec.endpoints:
-            if endpoint.method.upper() == method.upper():
-                is_match, _ = self._match_path_with_params(endpoint.path, path)
-                if is_match:
-                    endpoint_match = endpoint
-                    break
-                
         if not endpoint_match:
-            return headers
+            return {}
             
-        header_params = [p for p in endpoint_match.parameters if p.in_location == 'header']
+        return self._cached_sample(('headers', id(endpoint_match)), lambda: self._build_header_samples(endpoint_match))
+        
+    def _build_header_samples(self, endpoint_match: SwaggerEndpoint) -> Dict[str, str]:
+        """Get sample headers for an endpoint."""
+        headers: Dict[str, str] = {}
+        
+        header_params = self._params_in(endpoint_match, 'header')
         
         for param in header_params:
             sample_value = "sample_value"
@@ -196,17 +171,8 @@ class Swagger2Client(SwaggerClient):
         errors = []
         
         # Find matching endpoint
-        endpoint_match = None
-        path_params = {}
+        endpoint_match, path_params = self._find_endpoint(path, method)
         
-        for endpoint in self._spec.endpoints:
-            if endpoint.method.upper() == method.upper():
-                is_match, params = self._match_path_with_params(endpoint.path, path)
-                if is_match:
-                    endpoint_match = endpoint
-                    path_params = params
-                    break
-                
         if not endpoint_match:
             return False, ["Endpoint not found in specification"]
             
@@ -217,7 +183,7 @@ class Swagger2Client(SwaggerClient):
                 errors.append(f"Missing required path parameter: {param_name}")
             else:
                 # Find the parameter definition
-                param = next((p for p in endpoint_match.parameters if p.name == param_name and p.in_location == 'path'), None)
+                param = self._param_named(endpoint_match, 'path', param_name)
                 if param:
                     # Validate the parameter value
                     if param.enum and path_params[param_name] not in param.enum:
@@ -225,76 +191,24 @@ class Swagger2Client(SwaggerClient):
             
         # Check required parameters
         if headers:
-            header_params = [p for p in endpoint_match.parameters if p.in_location == 'header']
+            header_params = self._params_in(endpoint_match, 'header')
             for param in header_params:
                 if param.required and param.name not in headers:
                     errors.append(f"Missing required header parameter: {param.name}")
         
         # Check request body (very simple validation)
         if data:
-            body_params = [p for p in endpoint_match.parameters if p.in_location == 'body']
+            body_params = self._params_in(endpoint_match, 'body')
             if body_params and body_params[0].param_schema:
                 # Real validation would check against the schema
                 pass
                 
         return len(errors) == 0, errors
     
-    def _generate_sample_from_schema(self, schema: Dict[str, Any]) -> Any:
-        """
-        Generate a sample object from a JSON Schema.
-        
-        Args:
-            schema: JSON Schema
-            
-        Returns:
-            Sample data based on the schema
-        """
-        # Handle $ref (simple implementation - would need to be expanded)
-        if '$ref' in schema:
-            ref_path = schema['$ref']
-            if ref_path.startswith('#/definitions/'):
-                definition_name = ref_path.split('/')[-1]
-                definition = self._spec.definitions.get(definition_name, {})
-                return self._generate_sample_from_schema(definition)
-            return {}
-            
-        # Handle array
-        if schema.get('type') == 'array' and 'items' in schema:
-            items_schema = schema['items']
-            return [self._generate_sample_from_schema(items_schema)]
-            
-        # Handle object
-        if schema.get('type') == 'object' or 'properties' in schema:
-            result = {}
-            properties = schema.get('properties', {})
-            
-            for prop_name, prop_schema in properties.items():
-                result[prop_name] = self._generate_value_for_property(prop_schema)
-                
-            return result
-            
-        # Handle primitives
-        if schema.get('type') == 'string':
-            if 'enum' in schema and schema['enum']:
-                return schema['enum'][0]
-            return "string"
-        elif schema.get('type') == 'number' or schema.get('type') == 'integer':
-            return 0
-        elif schema.get('type') == 'boolean':
-            return False
-        
-        # Default
-        return {}
-    
     def _generate_value_for_property(self, prop_schema: Dict[str, Any]) -> Any:
         """Generate a sample value for a property."""
         if '$ref' in prop_schema:
-            ref_path = prop_schema['$ref']
-            if ref_path.startswith('#/definitions/'):
-                definition_name = ref_path.split('/')[-1]
-                definition = self._spec.definitions.get(definition_name, {})
-                return self._generate_sample_from_schema(definition)
-            return {}
+            return self._sample_for_ref(prop_schema['$ref'])
             
         prop_type = prop_schema.get('type', 'string')
         
@@ -304,31 +218,6 @@ class Swagger2Client(SwaggerClient):
             items = prop_schema.get('items', {})
             return [self._generate_value_for_property(items)]
         elif prop_type == 'string':
-            if 'enum' in prop_schema and prop_schema['enum']:
-                return prop_schema['enum'][0]
-            elif prop_schema.get('format') == 'date-time':
-                return "2023-01-01T00:00:00Z"
-            elif prop_schema.get('format') == 'date':
-                return "2023-01-01"
-            return "string"
-        elif prop_type == 'integer' or prop_type == 'number':
-            return 0
-        elif prop_type == 'boolean':
-            return False
-        else:
-            return None
-            
-    def _generate_sample_value(self, param: Any) -> Any:
-        """Generate a sample value for a parameter."""
-        if param.enum and param.enum[0]:
-            return param.enum[0]
-        elif param.default is not None:
-            return param.default
-        elif param.type == 'string':
-            return "string"
-        elif param.type == 'integer' or param.type == 'number':
-            return 0
-        elif param.type == 'boolean':
-            return False
-        else:
-            return None 
\ No newline at end of file
+            enum = prop_schema.get('enum')
+            return enum[0] if enum else FORMAT_SAMPLES.get(prop_schema.get('format'), "string")
+        return PRIMITIVE_SAMPLES.get(prop_type)
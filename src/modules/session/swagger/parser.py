@@ -1,14 +1,19 @@
 """Parser for Swagger/OpenAPI specifications."""
 
-import os
+import hashlib
 import json
+import os
+import pickle
 import yaml
 import requests
 import uuid
+import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 from urllib.parse import urlparse
 
+from .. import serialization
 from .schema import (
     SwaggerSpec, 
     SwaggerEndpoint, 
@@ -16,6 +21,19 @@ from .schema import (
     SwaggerSpecType
 )
 
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the pickled layout of SwaggerSpec changes
+SPEC_CACHE_VERSION = 2
+
+# Most binary spec caches kept; the least recently written are removed first
+SPEC_CACHE_MAX_FILES = 32
+
+# Key written into specs saved by save_swagger_spec, so loaders can tell them
+# apart from raw Swagger/OpenAPI documents with a single lookup
+SAVED_SPEC_MARKER = "__restbook_spec_version"
+SAVED_SPEC_VERSION = 1
+
 
 class SwaggerParserError(Exception):
     """Error raised during Swagger parsing."""
@@ -60,6 +78,28 @@ class SwaggerParser:
         except Exception as e:
             raise SwaggerParserError(f"Failed to parse Swagger spec: {str(e)}")
 
+    def parse_from_dict(self, spec_data: Dict[str, Any], source: Optional[str] = None) -> SwaggerSpec:
+        """
+        Parse a Swagger/OpenAPI specification that has already been loaded.
+        
+        The caller holds the current document, so the source-keyed cache used
+        by parse() is neither consulted nor filled.
+        
+        Args:
+            spec_data: Decoded specification document
+            source: Where the document came from, used in error messages
+            
+        Returns:
+            SwaggerSpec: Parsed Swagger specification
+            
+        Raises:
+            SwaggerParserError: If parsing fails
+        """
+        try:
+            return self._parse_spec(spec_data, source or "<dict>")
+        except Exception as e:
+            raise SwaggerParserError(f"Failed to parse Swagger spec: {str(e)}")
+
     def _load_spec(self, source: str) -> Dict[str, Any]:
         """
         Load a Swagger specification from a file or URL.
@@ -80,11 +120,12 @@ class SwaggerParser:
             # Load from URL
             response = requests.get(source)
             response.raise_for_status()
-            content = response.text
+            # Parse the raw bytes, skipping the decode into an intermediate str
+            content = response.content
             
             # Determine format (JSON or YAML)
             if response.headers.get('Content-Type', '').startswith('application/json'):
-                return json.loads(content)
+                return serialization.loads(content)
             else:
                 return yaml.safe_load(content)
         
@@ -92,13 +133,13 @@ class SwaggerParser:
         if not os.path.exists(source):
             raise FileNotFoundError(f"Swagger spec file not found: {source}")
             
-        with open(source, 'r') as f:
+        with open(source, 'rb') as f:
             content = f.read()
             
         # Try to parse as JSON, fall back to YAML
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
+            return serialization.loads(content)
+        except ValueError:
             try:
                 return yaml.safe_load(content)
             except yaml.YAMLError as e:
@@ -340,8 +381,142 @@ class SwaggerParser:
         filename = f"{name}-{uuid.uuid4()}.json"
         filepath = swagger_dir / filename
         
-        # Save spec as JSON using Pydantic's built-in JSON serialization
-        with open(filepath, 'w') as f:
-            f.write(spec.model_dump_json(indent=2, by_alias=True))
+        # Save spec as JSON, tagged so it is recognised as a saved SwaggerSpec
+        spec_data = spec.model_dump(mode='json', by_alias=True)
+        spec_data[SAVED_SPEC_MARKER] = SAVED_SPEC_VERSION
+        with open(filepath, 'wb') as f:
+            f.write(serialization.dumps_bytes(spec_data, indent=True))
             
-        return str(filepath) 
\ No newline at end of file
+        self.write_spec_cache(spec, str(filepath))
+        return str(filepath)
+
+    @staticmethod
+    def spec_cache_dir() -> Path:
+        """
+        Get the private directory holding binary spec caches.
+        
+        A cache is written for every spec file the client factory loads, so
+        the directory is bounded to SPEC_CACHE_MAX_FILES entries and older
+        caches are removed as new ones are written.
+        
+        Returns:
+            Path: Cache directory inside restbook's own swagger directory
+        """
+        return Path.home() / '.restbook' / 'swagger' / '.cache'
+
+    @staticmethod
+    def spec_cache_path(spec_path: str) -> str:
+        """
+        Get the path of the binary cache for a spec file.
+        
+        Caches live in restbook's private cache directory, named by a hash of
+        the spec's real path, so nothing is written or unpickled next to
+        user-provided spec files.
+        
+        Args:
+            spec_path: Path to the specification file
+            
+        Returns:
+            str: Path to the pickled specification
+        """
+        digest = hashlib.sha256(os.path.realpath(spec_path).encode()).hexdigest()
+        return str(SwaggerParser.spec_cache_dir() / f"{digest}.pkl")
+
+    @staticmethod
+    def write_spec_cache(spec: SwaggerSpec, spec_path: str) -> None:
+        """
+        Pickle a validated spec into the private cache directory.
+        
+        The cache starts with a header recording the JSON file's mtime and
+        size and a fingerprint of the SwaggerSpec schema, so it is ignored
+        once the JSON file or the models change. Failures are logged and
+        otherwise ignored, since the JSON file remains the source of truth.
+        
+        Args:
+            spec: Validated specification
+            spec_path: Path to the saved JSON specification
+        """
+        try:
+            cache_dir = SwaggerParser.spec_cache_dir()
+            cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with open(SwaggerParser.spec_cache_path(spec_path), 'wb') as f:
+                pickle.dump(_spec_cache_header(spec_path), f, protocol=5)
+                pickle.dump(spec, f, protocol=5)
+            _prune_spec_cache(cache_dir)
+        except Exception as e:
+            logger.debug("Could not write Swagger spec cache for %s: %s", spec_path, e)
+
+    @staticmethod
+    def load_cached_spec(spec_path: str) -> Optional[SwaggerSpec]:
+        """
+        Load a pickled spec if it is still in sync with its JSON file.
+        
+        The header is checked before the spec itself is unpickled, so caches
+        written for other models are never turned into objects.
+        
+        Args:
+            spec_path: Path to the saved JSON specification
+            
+        Returns:
+            Optional[SwaggerSpec]: Cached specification, or None if missing or stale
+        """
+        cache_path = SwaggerParser.spec_cache_path(spec_path)
+        try:
+            with open(cache_path, 'rb') as f:
+                if pickle.load(f) != _spec_cache_header(spec_path):
+                    return None
+                spec = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable Swagger spec cache %s: %s", cache_path, e)
+            return None
+            
+        return spec if isinstance(spec, SwaggerSpec) else None
+
+
+@lru_cache(maxsize=1)
+def _spec_schema_fingerprint() -> str:
+    """
+    Fingerprint the SwaggerSpec models and the pydantic version.
+    
+    Returns:
+        str: Hash that changes whenever pickled specs may no longer fit the models
+    """
+    import pydantic
+
+    schema = json.dumps(SwaggerSpec.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(f"{pydantic.VERSION}\n{schema}".encode()).hexdigest()
+
+
+def _spec_cache_header(spec_path: str) -> Tuple[Any, ...]:
+    """
+    Build the header that ties a spec cache to its JSON file and models.
+    
+    Args:
+        spec_path: Path to the saved JSON specification
+        
+    Returns:
+        Tuple[Any, ...]: Cache version, schema fingerprint, file mtime and size
+    """
+    stat = os.stat(spec_path)
+    return (SPEC_CACHE_VERSION, _spec_schema_fingerprint(), stat.st_mtime_ns, stat.st_size)
+
+
+def _prune_spec_cache(cache_dir: Path) -> None:
+    """
+    Remove the least recently written spec caches beyond SPEC_CACHE_MAX_FILES.
+    
+    Args:
+        cache_dir: Directory holding the spec caches
+    """
+    with os.scandir(cache_dir) as it:
+        caches = [(entry.stat().st_mtime_ns, entry.path) for entry in it if entry.name.endswith('.pkl')]
+    if len(caches) <= SPEC_CACHE_MAX_FILES:
+        return
+    caches.sort()
+    for _, path in caches[:-SPEC_CACHE_MAX_FILES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
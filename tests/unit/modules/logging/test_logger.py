@@ -0,0 +1,32 @@
+import pytest
+from src.modules.logging import create_logger
+
+
+class TestBufferedLogging:
+    """Test cases for BaseLogger.buffered."""
+
+    @pytest.fixture
+    def logger(self):
+        """Plain logger writing to stdout."""
+        return create_logger("plain")
+
+    def test_buffered_writes_once_on_exit(self, logger, capsys):
+        """Test that output inside the block is held until it exits."""
+        with logger.buffered():
+            logger.log_info("first")
+            with logger.buffered():
+                logger.log_info("second")
+            assert capsys.readouterr().out == ""
+            
+        output = capsys.readouterr().out
+        assert "first" in output
+        assert "second" in output
+
+    def test_buffered_flushes_on_error(self, logger, capsys):
+        """Test that buffered output is still written when the block raises."""
+        with pytest.raises(RuntimeError):
+            with logger.buffered():
+                logger.log_error("failure")
+                raise RuntimeError()
+                
+        assert "failure" in capsys.readouterr().out
@@ -72,4 +72,9 @@ class TestBasicAuthenticator:
     def test_create_auth_header(self, credentials, expected_auth_header):
         """Test creation of auth header string."""
         auth = BasicAuthenticator(credentials)
-        assert auth._auth_header == expected_auth_header 
\ No newline at end of file
+        assert auth._auth_header == expected_auth_header 
+
+    def test_get_headers_reuses_cached_dict(self, credentials):
+        """Test that repeated calls return the precomputed headers."""
+        auth = BasicAuthenticator(credentials)
+        assert auth.get_headers() is auth.get_headers()
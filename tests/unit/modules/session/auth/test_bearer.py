@@ -44,4 +44,9 @@ class TestBearerAuthenticator:
         """Test getting authentication headers."""
         auth = BearerAuthenticator(credentials)
         headers = auth.get_headers()
-        assert headers == {"Authorization": f"Bearer {token}"} 
\ No newline at end of file
+        assert headers == {"Authorization": f"Bearer {token}"} 
+
+    def test_get_headers_reuses_cached_dict(self, credentials):
+        """Test that repeated calls return the precomputed headers."""
+        auth = BearerAuthenticator(credentials)
+        assert auth.get_headers() is auth.get_headers()
@@ -1,12 +1,20 @@
 import pytest
 import aiohttp
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.modules.session.auth import oauth2
 from src.modules.session.auth.oauth2 import OAuth2Authenticator
 
 
 class TestOAuth2Authenticator:
     """Test cases for OAuth2Authenticator class."""
 
+    @pytest.fixture(autouse=True)
+    def clear_token_cache(self):
+        """Isolate tests from tokens cached by other authenticators."""
+        oauth2._TOKEN_CACHE.clear()
+        yield
+        oauth2._TOKEN_CACHE.clear()
+
     @pytest.fixture
     def client_id(self):
         """Client ID for testing."""
@@ -64,3 +72,139 @@ class TestOAuth2Authenticator:
         del credentials["client_id"]
         with pytest.raises(ValueError, match="OAuth2 authentication requires 'client_id' in credentials"):
             OAuth2Authenticator(credentials)
+
+    def test_grant_type_setup(self, credentials):
+        """Test grant type validation via the setup dispatch table."""
+        auth = OAuth2Authenticator({**credentials, "grant_type": "client_credentials"})
+        assert auth.grant_type == "client_credentials"
+
+        with pytest.raises(ValueError, match="Unsupported grant type: implicit"):
+            OAuth2Authenticator({**credentials, "grant_type": "implicit"})
+
+        with pytest.raises(ValueError, match="Authorization code grant type requires 'redirect_uri'"):
+            OAuth2Authenticator({**credentials, "grant_type": "authorization_code"})
+
+    def test_password_grant_prebuilds_token_request_data(self, credentials, client_id, client_secret):
+        """Test that static token request fields are built once at init."""
+        credentials.update({
+            "grant_type": "password",
+            "username": "user",
+            "password": "pass",
+            "scope": "read"
+        })
+        auth = OAuth2Authenticator(credentials)
+        assert auth._auth_data == {
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "grant_type": "password",
+            "username": "user",
+            "password": "pass",
+            "scope": "read"
+        }
+        assert auth._base_data == {
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "grant_type": "password"
+        }
+        assert auth._auth_body == (
+            f"client_id={client_id}&client_secret={client_secret}"
+            "&grant_type=password&username=user&password=pass&scope=read"
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_error_message(self):
+        """Test error messages are extracted from JSON and plain-text bodies."""
+        response = AsyncMock()
+        response.read.return_value = b'{"error": "invalid_client"}'
+        assert await OAuth2Authenticator._read_error_message(response) == "invalid_client"
+
+        response.read.return_value = b"Bad Request"
+        assert await OAuth2Authenticator._read_error_message(response) == "Bad Request"
+        response.read.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_authenticate_uses_injected_http_session(self, credentials, token_response, access_token):
+        """Test that an injected HTTP session is reused for token requests."""
+        response = AsyncMock()
+        response.status = 200
+        response.json.return_value = token_response
+        http_session = MagicMock()
+        http_session.closed = False
+        http_session.post.return_value.__aenter__.return_value = response
+
+        auth = OAuth2Authenticator(credentials)
+        auth.http_session = http_session
+        await auth.authenticate()
+
+        http_session.post.assert_called_once_with(
+            credentials["token_url"],
+            data=auth._auth_body,
+            headers=OAuth2Authenticator.FORM_HEADERS
+        )
+        assert auth.is_authenticated is True
+        assert auth.get_headers() == {"Authorization": f"Bearer {access_token}"}
+
+    def test_is_token_valid_respects_expiry(self, credentials):
+        """Test that an expired token is reported as invalid."""
+        auth = OAuth2Authenticator(credentials)
+        assert auth.is_token_valid() is False
+
+        auth.is_authenticated = True
+        assert auth.is_token_valid() is True
+
+        with patch("src.modules.session.auth.oauth2.time.monotonic", return_value=100.0):
+            auth._expires_at = 50.0
+            assert auth.is_token_valid() is False
+            auth._expires_at = 150.0
+            assert auth.is_token_valid() is True
+
+    @pytest.mark.asyncio
+    async def test_authenticate_reuses_cached_token(self, credentials, token_response, access_token):
+        """Test that authenticators with the same credentials share an unexpired token."""
+        response = AsyncMock()
+        response.status = 200
+        response.json.return_value = token_response
+        http_session = MagicMock()
+        http_session.closed = False
+        http_session.post.return_value.__aenter__.return_value = response
+
+        first = OAuth2Authenticator(dict(credentials))
+        first.http_session = http_session
+        await first.authenticate()
+
+        second = OAuth2Authenticator(dict(credentials))
+        second.http_session = http_session
+        await second.authenticate()
+
+        http_session.post.assert_called_once()
+        assert second.get_headers() == {"Authorization": f"Bearer {access_token}"}
+
+        # Refreshing drops the shared token so it is not handed out again
+        await second.refresh()
+        assert http_session.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_grants_do_not_share_tokens(self, credentials, token_response):
+        """Test that authenticators with different refresh tokens never share a token."""
+        responses = []
+        for token in ("token-a", "token-b"):
+            response = AsyncMock()
+            response.status = 200
+            response.json.return_value = {**token_response, "access_token": token}
+            responses.append(response)
+        http_session = MagicMock()
+        http_session.closed = False
+        http_session.post.return_value.__aenter__.side_effect = responses
+
+        first = OAuth2Authenticator({**credentials, "grant_type": "refresh_token", "refresh_token": "user-a"})
+        first.http_session = http_session
+        await first.authenticate()
+
+        second = OAuth2Authenticator({**credentials, "grant_type": "refresh_token", "refresh_token": "user-b"})
+        second.http_session = http_session
+        await second.authenticate()
+
+        assert http_session.post.call_count == 2
+        assert "refresh_token=user-b" in http_session.post.call_args.kwargs["data"]
+        assert first.get_headers() == {"Authorization": "Bearer token-a"}
+        assert second.get_headers() == {"Authorization": "Bearer token-b"}
@@ -0,0 +1,253 @@
+import pytest
+from src.modules.session.swagger import SwaggerSpec, SwaggerSpecType, SwaggerEndpoint, SwaggerEndpointParameter, OpenAPI3Client, Swagger2Client
+
+
+class TestSwaggerClientPaths:
+    """Test cases for path matching helpers on SwaggerClient."""
+
+    @pytest.fixture
+    def client(self):
+        """OpenAPI 3 client for an empty specification."""
+        spec = SwaggerSpec(
+            title="Pets",
+            version="1.0.0",
+            spec_type=SwaggerSpecType.OPENAPI_3,
+            endpoints=[],
+            paths={}
+        )
+        return OpenAPI3Client(spec)
+
+    def test_match_path_with_params(self, client):
+        """Test matching request paths against parameterized spec paths."""
+        assert client._match_path_with_params("/pet/{petId}", "/pet/123") == (True, {"petId": "123"})
+        assert client._match_path_with_params("/pet/{petId}", "/pet/123/tags") == (False, {})
+        assert client._match_path_with_params("/pet/{petId}", "/pet/456") == (True, {"petId": "456"})
+
+    def test_get_path_params(self, client):
+        """Test extracting parameter names from a spec path."""
+        params = client._get_path_params("/store/{storeId}/pet/{petId}")
+        assert params == ["storeId", "petId"]
+        
+        # Callers get their own list even though the names are cached
+        params.append("extra")
+        assert client._get_path_params("/store/{storeId}/pet/{petId}") == ["storeId", "petId"]
+
+    def test_replace_path_params(self, client):
+        """Test substituting parameter values into a spec path."""
+        path = client._replace_path_params("/store/{storeId}/pet/{pet.id}", {"storeId": "1", "pet.id": "2"})
+        assert path == "/store/1/pet/2"
+        
+        # Missing parameters keep their placeholder
+        assert client._replace_path_params("/pet/{petId}", {}) == "/pet/{petId}"
+
+    @pytest.fixture
+    def routed_client(self):
+        """OpenAPI 3 client with overlapping literal and parameterized paths."""
+        endpoints = [
+            SwaggerEndpoint(path="/pet/{petId}", method="get", operation_id="getPet"),
+            SwaggerEndpoint(path="/pet/findByStatus", method="get", operation_id="findByStatus"),
+            SwaggerEndpoint(path="/pet/findByStatus", method="post", operation_id="postStatus"),
+            SwaggerEndpoint(path="/store/{storeId}/pet/{petId}", method="get", operation_id="getStorePet"),
+            SwaggerEndpoint(path="/files/{name}.json", method="get", operation_id="getFile"),
+            SwaggerEndpoint(path="/pet/{id}/tags", method="get", operation_id="getPetTags"),
+        ]
+        spec = SwaggerSpec(
+            title="Pets",
+            version="1.0.0",
+            spec_type=SwaggerSpecType.OPENAPI_3,
+            endpoints=endpoints,
+            paths={}
+        )
+        return OpenAPI3Client(spec)
+
+    def test_find_endpoint(self, routed_client):
+        """Test looking up endpoints by request path and method."""
+        endpoint, params = routed_client._find_endpoint("/store/1/pet/2", "GET")
+        assert endpoint.operation_id == "getStorePet"
+        assert params == {"storeId": "1", "petId": "2"}
+        
+        endpoint, params = routed_client._find_endpoint("/files/report.json", "get")
+        assert endpoint.operation_id == "getFile"
+        assert params == {"name": "report"}
+        
+        # Placeholders with different names at the same position bind their own name
+        endpoint, params = routed_client._find_endpoint("/pet/1/tags", "get")
+        assert endpoint.operation_id == "getPetTags"
+        assert params == {"id": "1"}
+        
+        assert routed_client._find_endpoint("/pet/1/photos", "get") == (None, {})
+        assert routed_client._find_endpoint("/pet/", "get") == (None, {})
+        assert routed_client._find_endpoint("/pet/1", "delete") == (None, {})
+
+    def test_get_available_endpoints(self, routed_client):
+        """Test listing endpoints, optionally filtered by method."""
+        all_paths = [e['path'] for e in routed_client.get_available_endpoints()]
+        assert all_paths == [
+            "/pet/{petId}", "/pet/findByStatus", "/pet/findByStatus",
+            "/store/{storeId}/pet/{petId}", "/files/{name}.json", "/pet/{id}/tags"
+        ]
+        
+        posts = routed_client.get_available_endpoints("post")
+        assert [(e['method'], e['operation_id']) for e in posts] == [("POST", "postStatus")]
+        assert routed_client.get_available_endpoints("DELETE") == []
+
+    def test_find_endpoint_prefers_first_declared(self, routed_client):
+        """Test that overlapping paths resolve to the endpoint declared first."""
+        endpoint, params = routed_client._find_endpoint("/pet/findByStatus", "get")
+        assert endpoint.operation_id == "getPet"
+        assert params == {"petId": "findByStatus"}
+        
+        endpoint, params = routed_client._find_endpoint("/pet/findByStatus", "post")
+        assert endpoint.operation_id == "postStatus"
+        assert params == {}
+
+
+class TestSwaggerClientSamples:
+    """Test cases for sample generation on SwaggerClient."""
+
+    @pytest.fixture
+    def client(self):
+        """OpenAPI 3 client whose request body refers to a self-referencing schema."""
+        user_ref = {"$ref": "#/components/schemas/User"}
+        spec = SwaggerSpec(
+            title="Users",
+            version="1.0.0",
+            spec_type=SwaggerSpecType.OPENAPI_3,
+            endpoints=[
+                SwaggerEndpoint(
+                    path="/users",
+                    method="post",
+                    request_body={"content": {"application/json": {"schema": user_ref}}}
+                )
+            ],
+            components={
+                "schemas": {
+                    "User": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "manager": user_ref
+                        }
+                    }
+                }
+            }
+        )
+        return OpenAPI3Client(spec)
+
+    def test_ref_sample_generated_once(self, client, monkeypatch):
+        """Test that referenced schemas are sampled once and handed out as copies."""
+        sample = client.get_request_sample("/users", "POST")
+        assert sample == {"name": "string", "manager": {}}
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("schema sampled again")
+        sample["name"] = "changed"
+        monkeypatch.setattr(client, "_generate_sample_from_schema", fail)
+        assert client._ref_sample("User", fail) == {"name": "string", "manager": {}}
+
+    def test_ref_cycle_samples_do_not_depend_on_order(self):
+        """Test that schemas referring to each other sample the same in any order."""
+        def make_client():
+            return OpenAPI3Client(SwaggerSpec(
+                title="Pets",
+                version="1.0.0",
+                spec_type=SwaggerSpecType.OPENAPI_3,
+                components={
+                    "schemas": {
+                        "Owner": {"type": "object", "properties": {"pet": {"$ref": "#/components/schemas/Pet"}}},
+                        "Pet": {"type": "object", "properties": {"owner": {"$ref": "#/components/schemas/Owner"}}}
+                    }
+                }
+            ))
+        owner = {"$ref": "#/components/schemas/Owner"}
+        pet = {"$ref": "#/components/schemas/Pet"}
+
+        client = make_client()
+        assert client._generate_sample_from_schema(owner) == {"pet": {"owner": {}}}
+        assert client._generate_sample_from_schema(pet) == {"owner": {"pet": {}}}
+
+        client = make_client()
+        assert client._generate_sample_from_schema(pet) == {"owner": {"pet": {}}}
+        assert client._generate_sample_from_schema(owner) == {"pet": {"owner": {}}}
+
+    def test_request_sample_cached_per_endpoint(self, client, monkeypatch):
+        """Test that repeated sample requests reuse the generated sample."""
+        first = client.get_request_sample("/users", "POST")
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("sample generated again")
+        monkeypatch.setattr(client, "_build_request_sample", fail)
+        second = client.get_request_sample("/users", "POST")
+        assert second == first
+        assert second is not first
+
+    def test_swagger2_ref_samples(self):
+        """Test that Swagger 2 references resolve against definitions."""
+        spec = SwaggerSpec(
+            title="Users",
+            version="1.0.0",
+            spec_type=SwaggerSpecType.SWAGGER_2,
+            definitions={"User": {"type": "object", "properties": {"born": {"type": "string", "format": "date"}}}}
+        )
+        client = Swagger2Client(spec)
+        assert client._generate_sample_from_schema({"$ref": "#/definitions/User"}) == {"born": "2023-01-01"}
+        assert client._generate_sample_from_schema({"$ref": "#/components/schemas/User"}) == {}
+
+    def test_primitive_samples(self, client):
+        """Test the sample values used for primitive schema types."""
+        generate = client._generate_sample_from_schema
+        assert generate({"type": "string"}) == "string"
+        assert generate({"type": "string", "format": "date"}) == "2023-01-01"
+        assert generate({"type": "string", "enum": ["a", "b"]}) == "a"
+        assert generate({"type": "integer"}) == 0
+        assert generate({"type": "boolean"}) is False
+        assert generate({"type": "null"}) == {}
+
+
+class TestSwaggerClientParameters:
+    """Test cases for endpoint parameter lookups on SwaggerClient."""
+
+    @pytest.fixture
+    def client(self):
+        """OpenAPI 3 client with path and header parameters."""
+        parameters = [
+            SwaggerEndpointParameter(**{"name": "kind", "in": "path", "required": True, "enum": ["cat", "dog"]}),
+            SwaggerEndpointParameter(**{"name": "X-Token", "in": "header", "required": True}),
+            SwaggerEndpointParameter(**{"name": "X-Trace", "in": "header", "default": "abc"}),
+        ]
+        spec = SwaggerSpec(
+            title="Pets",
+            version="1.0.0",
+            spec_type=SwaggerSpecType.OPENAPI_3,
+            endpoints=[SwaggerEndpoint(path="/pets/{kind}", method="get", parameters=parameters)]
+        )
+        return OpenAPI3Client(spec)
+
+    def test_params_grouped_by_location(self, client):
+        """Test looking up parameters by location and name."""
+        endpoint = client._spec.endpoints[0]
+        assert [p.name for p in client._params_in(endpoint, "header")] == ["X-Token", "X-Trace"]
+        assert client._params_in(endpoint, "query") == []
+        assert client._param_named(endpoint, "path", "kind").enum == ["cat", "dog"]
+        assert client._param_named(endpoint, "header", "kind") is None
+        assert client.get_header_samples("/pets/cat", "GET") == {"X-Token": "sample_value", "X-Trace": "abc"}
+
+    def test_endpoint_details_built_once(self, client):
+        """Test that endpoint details are reused with per-request path params."""
+        cat = client.get_endpoint_details("/pets/cat", "get")
+        dog = client.get_endpoint_details("/pets/dog", "get")
+        assert cat["path_params"] == {"kind": "cat"}
+        assert dog["path_params"] == {"kind": "dog"}
+        assert [p["name"] for p in dog["parameters"]] == ["kind", "X-Token", "X-Trace"]
+        assert cat["parameters"] is dog["parameters"]
+
+    def test_validate_request_uses_parameters(self, client):
+        """Test that path enums and required headers are validated."""
+        assert client.validate_request("/pets/cat", "GET", headers={"X-Token": "t"}) == (True, [])
+        
+        is_valid, errors = client.validate_request("/pets/fish", "GET", headers={"X-Other": "1"})
+        assert not is_valid
+        assert errors == [
+            "Invalid value for path parameter kind: must be one of ['cat', 'dog']",
+            "Missing required header parameter: X-Token",
+        ]
@@ -0,0 +1,195 @@
+import pytest
+import json
+import os
+from src.modules.session.swagger import SwaggerParser, SwaggerSpec, SwaggerClientFactory, OpenAPI3Client
+from src.modules.session.swagger import parser as parser_module
+from src.modules.session.swagger.parser import SAVED_SPEC_MARKER, SAVED_SPEC_VERSION
+from src.modules.session.session import Session
+
+
+class TestSwaggerParser:
+    """Test cases for SwaggerParser class."""
+
+    @pytest.fixture(autouse=True)
+    def home(self, tmp_path, monkeypatch):
+        """Keep restbook's directories under a temporary home."""
+        home = tmp_path / "home"
+        monkeypatch.setenv("HOME", str(home))
+        return home
+
+    @pytest.fixture
+    def openapi_file(self, tmp_path):
+        """Create a minimal OpenAPI 3 specification file."""
+        spec = {
+            "openapi": "3.0.0",
+            "info": {"title": "Pets", "version": "1.0.0"},
+            "servers": [{"url": "https://api.example.com"}],
+            "paths": {
+                "/pets/{petId}": {
+                    "get": {
+                        "operationId": "getPet",
+                        "parameters": [
+                            {"name": "petId", "in": "path", "required": True, "schema": {"type": "integer"}}
+                        ],
+                        "responses": {"200": {"description": "A pet"}}
+                    }
+                }
+            }
+        }
+        spec_dir = tmp_path / "specs"
+        spec_dir.mkdir()
+        spec_file = spec_dir / "pets.json"
+        spec_file.write_text(json.dumps(spec))
+        return str(spec_file)
+
+    @pytest.fixture
+    def saved_spec_path(self, openapi_file):
+        """Parse and save the specification under the temporary home."""
+        parser = SwaggerParser()
+        return parser.save_swagger_spec(parser.parse(openapi_file), "pets")
+
+    def test_save_writes_spec_cache(self, saved_spec_path):
+        """Test that saving a spec also writes a binary cache."""
+        assert os.path.exists(SwaggerParser.spec_cache_path(saved_spec_path))
+        
+        cached = SwaggerParser.load_cached_spec(saved_spec_path)
+        assert isinstance(cached, SwaggerSpec)
+        assert cached.title == "Pets"
+        assert cached.endpoints[0].operation_id == "getPet"
+
+    def test_spec_cache_invalidated_on_change(self, saved_spec_path):
+        """Test that the cache is ignored once the JSON file changes."""
+        with open(saved_spec_path, 'a') as f:
+            f.write("\n")
+            
+        assert SwaggerParser.load_cached_spec(saved_spec_path) is None
+
+    def test_spec_cache_invalidated_on_model_change(self, saved_spec_path, monkeypatch):
+        """Test that the cache is not unpickled once the SwaggerSpec models change."""
+        offsets = []
+        real_load = parser_module.pickle.load
+        def load(f):
+            offsets.append(f.tell())
+            return real_load(f)
+        monkeypatch.setattr(parser_module.pickle, "load", load)
+        monkeypatch.setattr(parser_module, "_spec_schema_fingerprint", lambda: "other-models")
+        
+        assert SwaggerParser.load_cached_spec(saved_spec_path) is None
+        # Only the header was read
+        assert offsets == [0]
+
+    def test_spec_cache_is_bounded(self, tmp_path, monkeypatch):
+        """Test that only the most recently written caches are kept."""
+        monkeypatch.setattr(parser_module, "SPEC_CACHE_MAX_FILES", 2)
+        parser = SwaggerParser()
+        spec = parser.parse_from_dict({"openapi": "3.0.0", "info": {"title": "T", "version": "1"}, "paths": {}})
+        paths = []
+        for index in range(3):
+            path = tmp_path / f"spec{index}.json"
+            path.write_text("{}")
+            SwaggerParser.write_spec_cache(spec, str(path))
+            # Order the caches by write time even on coarse clocks
+            os.utime(SwaggerParser.spec_cache_path(str(path)), ns=(index, index))
+            paths.append(str(path))
+        
+        assert sorted(os.listdir(SwaggerParser.spec_cache_dir())) == sorted(
+            os.path.basename(SwaggerParser.spec_cache_path(path)) for path in paths[1:]
+        )
+        assert SwaggerParser.load_cached_spec(paths[0]) is None
+        assert SwaggerParser.load_cached_spec(paths[1]) is not None
+
+    def test_factory_uses_spec_cache(self, saved_spec_path):
+        """Test that the client factory loads from the cache."""
+        client = SwaggerClientFactory.create_from_file(saved_spec_path)
+        assert isinstance(client, OpenAPI3Client)
+        assert client.api_title == "Pets"
+
+    def test_factory_shares_client_until_file_changes(self, saved_spec_path):
+        """Test that clients are shared per unchanged spec file."""
+        client = SwaggerClientFactory.create_from_file(saved_spec_path)
+        assert SwaggerClientFactory.create_from_file(saved_spec_path) is client
+        
+        # Another spelling of the same path shares the cached client
+        directory, filename = os.path.split(saved_spec_path)
+        assert SwaggerClientFactory.create_from_file(os.path.join(directory, ".", filename)) is client
+        
+        SwaggerClientFactory.clear_cache()
+        assert SwaggerClientFactory.create_from_file(saved_spec_path) is not client
+        client = SwaggerClientFactory.create_from_file(saved_spec_path)
+        
+        with open(saved_spec_path, 'a') as f:
+            f.write("\n")
+            
+        assert SwaggerClientFactory.create_from_file(saved_spec_path) is not client
+
+    def test_sessions_share_swagger_client(self, saved_spec_path):
+        """Test that sessions using the same spec share one client."""
+        first = Session(name="first", base_url="https://api.example.com", swagger_spec_path=saved_spec_path)
+        second = Session(name="second", base_url="https://api.example.com", swagger_spec_path=saved_spec_path)
+        assert first.swagger_client is not None
+        assert first.swagger_client is second.swagger_client
+        
+        first.swagger_spec_path = None
+        assert first.swagger_client is None
+
+    def test_factory_caches_raw_spec(self, openapi_file):
+        """Test that parsing a raw spec file also writes its binary cache."""
+        client = SwaggerClientFactory.create_from_file(openapi_file)
+        assert isinstance(client, OpenAPI3Client)
+        assert SwaggerParser.load_cached_spec(openapi_file).title == "Pets"
+        
+        # The cache lives in restbook's own directory, not next to the user's file
+        assert os.listdir(os.path.dirname(openapi_file)) == ["pets.json"]
+        assert os.path.dirname(SwaggerParser.spec_cache_path(openapi_file)) == str(SwaggerParser.spec_cache_dir())
+
+    def test_pickle_next_to_spec_is_never_loaded(self, openapi_file, tmp_path):
+        """Test that a pickle planted next to a spec file is not unpickled."""
+        marker = tmp_path / "planted"
+        with open(f"{openapi_file}.pkl", 'wb') as f:
+            f.write(b"cos\nsystem\n(S'touch " + str(marker).encode() + b"'\ntR.")
+            
+        assert SwaggerParser.load_cached_spec(openapi_file) is None
+        assert isinstance(SwaggerClientFactory.create_from_file(openapi_file), OpenAPI3Client)
+        assert not marker.exists()
+
+    def test_parse_from_dict(self, openapi_file):
+        """Test that an already decoded document parses like the file it came from."""
+        with open(openapi_file) as f:
+            spec_data = json.load(f)
+            
+        spec = SwaggerParser().parse_from_dict(spec_data, openapi_file)
+        assert spec.title == "Pets"
+        assert spec.endpoints[0].operation_id == "getPet"
+
+    def test_factory_reads_raw_spec_once(self, openapi_file, monkeypatch):
+        """Test that the factory does not load a raw spec file a second time."""
+        def fail(*args, **kwargs):
+            raise AssertionError("spec file loaded twice")
+        monkeypatch.setattr(SwaggerParser, "_load_spec", fail)
+        
+        client = SwaggerClientFactory.create_from_file(openapi_file)
+        assert isinstance(client, OpenAPI3Client)
+
+    def test_saved_spec_is_marked(self, saved_spec_path):
+        """Test that saved specs carry the marker and load without the binary cache."""
+        with open(saved_spec_path) as f:
+            assert json.load(f)[SAVED_SPEC_MARKER] == SAVED_SPEC_VERSION
+            
+        os.remove(SwaggerParser.spec_cache_path(saved_spec_path))
+        client = SwaggerClientFactory.create_from_file(saved_spec_path)
+        assert isinstance(client, OpenAPI3Client)
+        assert client.api_title == "Pets"
+
+    def test_factory_shared_parser_sees_file_changes(self, openapi_file):
+        """Test that reusing the factory's parser never serves a stale spec."""
+        assert SwaggerClientFactory.create_from_file(openapi_file).api_title == "Pets"
+        
+        with open(openapi_file) as f:
+            spec_data = json.load(f)
+        spec_data["info"]["title"] = "Pets v2"
+        with open(openapi_file, 'w') as f:
+            json.dump(spec_data, f)
+        os.remove(SwaggerParser.spec_cache_path(openapi_file))
+        
+        assert SwaggerClientFactory.create_from_file(openapi_file).api_title == "Pets v2"
+        assert SwaggerClientFactory._get_parser() is SwaggerClientFactory._get_parser()
@@ -0,0 +1,91 @@
+import pytest
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from click.testing import CliRunner
+from src.modules.session.commands import create_session_commands
+from src.modules.session.session_store import SessionStore
+
+
+class TestSessionCommands:
+    """Test cases for the session command group."""
+
+    @pytest.fixture
+    def session_store(self, tmp_path):
+        """Create a SessionStore instance with a temporary file."""
+        return SessionStore(sessions_file=str(tmp_path / "sessions.json"))
+
+    @pytest.fixture
+    def logger(self):
+        """Logger recording every message."""
+        return MagicMock()
+
+    @pytest.fixture
+    def invoke(self, session_store, logger):
+        """Run a session subcommand against the temporary store."""
+        def run(*args):
+            obj = SimpleNamespace(session_store=session_store, logger=logger)
+            return CliRunner().invoke(create_session_commands(), list(args), obj=obj)
+        return run
+
+    def test_show_non_string_credentials(self, invoke, session_store, logger):
+        """Test that credentials with non-string values can be shown."""
+        session_store.upsert_session("o", {
+            "base_url": "https://api.example.com",
+            "auth": {
+                "type": "oauth2",
+                "credentials": {
+                    "client_id": "id",
+                    "client_secret": "secret",
+                    "token_url": "https://auth.example.com/token",
+                    "scopes": ["r", "w"]
+                }
+            }
+        })
+
+        result = invoke("show", "o")
+        assert result.exit_code == 0, result.output
+        output = logger.log_info.call_args.args[0]
+        assert "    scopes: ['r', 'w']" in output
+        assert "    client_secret: ********" in output
+
+    def test_batch_authenticate_continues_after_invalid_session(self, tmp_path, logger):
+        """Test that a session with invalid credentials does not stop the batch."""
+        sessions_file = tmp_path / "sessions.json"
+        sessions_file.write_text(json.dumps({
+            "d": {"base_url": "https://d.example.com", "auth": {"type": "bearer", "credentials": {}}},
+            "a": {"base_url": "https://a.example.com", "auth": {"type": "api_key", "credentials": {"api_key": "k"}}}
+        }))
+        obj = SimpleNamespace(session_store=SessionStore(sessions_file=str(sessions_file)), logger=logger)
+
+        result = CliRunner().invoke(create_session_commands(), ["batch-authenticate", "d", "a"], obj=obj)
+        assert result.exit_code == 0, result.output
+        errors = [call.args[0] for call in logger.log_error.call_args_list]
+        assert errors == ["\nAuthentication failed: Bearer authentication requires 'token' in credentials"]
+        infos = [call.args[0] for call in logger.log_info.call_args_list]
+        assert "\nSession: a" in infos
+        assert "\nAuthentication successful!" in infos
+        assert "  X-API-Key: ********" in infos
+
+    def test_update_rename_never_overwrites(self, invoke, session_store, logger):
+        """Test that renaming onto an existing session is refused with or without other changes."""
+        session_store.upsert_session("a", {"base_url": "https://a.example.com", "auth": None})
+        session_store.upsert_session("d", {"base_url": "https://d.example.com", "auth": None})
+
+        invoke("update", "a", "--new-name", "d")
+        invoke("update", "a", "--new-name", "d", "--base-url", "https://x.example.com")
+        invoke("update", "a", "--new-name", "d", "--auth-type", "api_key", "--auth-credentials", '{"api_key": "k"}')
+
+        errors = [call.args[0] for call in logger.log_error.call_args_list]
+        assert errors == ["Session 'd' already exists"] * 3
+        assert session_store.get_session("a").base_url == "https://a.example.com"
+        assert session_store.get_session("d").base_url == "https://d.example.com"
+
+    def test_update_same_base_url_is_unchanged(self, invoke, session_store, logger, monkeypatch):
+        """Test that setting the current base URL again does not rewrite the store."""
+        session_store.upsert_session("a", {"base_url": "https://a.example.com", "auth": None})
+        monkeypatch.setattr(session_store, "_save_sessions", MagicMock(side_effect=AssertionError("saved")))
+
+        result = invoke("update", "a", "--base-url", "https://a.example.com")
+        assert result.exit_code == 0, result.output
+        logger.log_info.assert_called_once_with("Session 'a' unchanged")
@@ -0,0 +1,38 @@
+import json
+import pytest
+from src.modules.session import serialization
+
+
+class TestSerialization:
+    """Test cases for session JSON helpers."""
+
+    @pytest.fixture(autouse=True, params=["json", "orjson"])
+    def backend(self, request, monkeypatch):
+        """Run each test with the stdlib backend and, when installed, with orjson."""
+        module = pytest.importorskip("orjson") if request.param == "orjson" else None
+        monkeypatch.setattr(serialization, "orjson", module)
+        return request.param
+
+    @pytest.fixture
+    def data(self):
+        """Sample session data."""
+        return {"api": {"base_url": "https://api.example.com", "auth": None}}
+
+    def test_round_trip(self, data):
+        """Test that dumps and loads round-trip session data."""
+        assert serialization.loads(serialization.dumps(data)) == data
+        assert serialization.loads(serialization.dumps(data).encode()) == data
+
+    def test_indent_matches_stdlib(self, data):
+        """Test that indented output matches the stdlib format."""
+        assert serialization.dumps(data, indent=True) == json.dumps(data, indent=2)
+
+    def test_loads_invalid(self):
+        """Test that invalid JSON raises ValueError."""
+        with pytest.raises(ValueError):
+            serialization.loads("invalid json")
+
+    def test_dumps_bytes_compact(self, data):
+        """Test that compact byte output has no whitespace between tokens."""
+        assert serialization.dumps_bytes(data) == json.dumps(data, separators=(',', ':')).encode()
+        assert serialization.dumps_bytes(data, indent=True) == json.dumps(data, indent=2).encode()
@@ -122,4 +122,49 @@ class TestSession:
         """Test refresh_auth method on session without auth."""
         session = Session(name=session_name, base_url=base_url)
         await session.refresh_auth()  # Should not raise any error
-        assert session.is_authenticated() is True
\ No newline at end of file
+        assert session.is_authenticated() is True
+
+    def test_has_swagger_checks_spec_file_once_per_path(self, session_name, base_url, tmp_path, monkeypatch):
+        """Test that has_swagger caches the spec file check until the path changes."""
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text("{}")
+        session = Session(name=session_name, base_url=base_url, swagger_spec_path=str(spec_file))
+        assert session.has_swagger() is True
+        
+        # A cached result is reused without touching the filesystem
+        monkeypatch.setattr("os.path.exists", lambda path: False)
+        assert session.has_swagger() is True
+        
+        session.swagger_spec_path = str(tmp_path / "other.json")
+        assert session.has_swagger() is False
+
+    def test_refresh_swagger_path_rechecks_spec_file(self, session_name, base_url, tmp_path):
+        """Test that refresh_swagger_path picks up a spec file created after the first check."""
+        spec_file = tmp_path / "spec.json"
+        session = Session(name=session_name, base_url=base_url, swagger_spec_path=str(spec_file))
+        assert session.has_swagger() is False
+        
+        spec_file.write_text("{}")
+        assert session.has_swagger() is False
+        session.refresh_swagger_path()
+        assert session.has_swagger() is True
+
+    def test_authenticator_created_on_first_use(self, session_name, base_url):
+        """Test that invalid auth config only fails once the authenticator is needed."""
+        session = Session(
+            name=session_name,
+            base_url=base_url,
+            auth_config=AuthConfig(type="bearer", credentials={})
+        )
+        with pytest.raises(ValueError, match="Bearer authentication requires 'token'"):
+            session.get_headers()
+
+    def test_to_dict_cached_until_field_changes(self, session_name, base_url):
+        """Test that to_dict is reused until a persisted field is reassigned."""
+        session = Session(name=session_name, base_url=base_url)
+        data = session.to_dict()
+        assert session.to_dict() is data
+        
+        session.base_url = "https://new.example.com"
+        assert session.to_dict() is not data
+        assert session.to_dict()["base_url"] == "https://new.example.com"
@@ -1,9 +1,10 @@
 import pytest
 import os
 import json
-from src.modules.session.session_store import SessionStore
+from src.modules.session.session_store import SessionStore, get_default_session_store
 from src.modules.session.session import Session
 from src.modules.session.auth import AuthConfig
+from src.modules.session import serialization
 
 
 class TestSessionStore:
@@ -54,6 +55,12 @@ class TestSessionStore:
         assert session.auth_config.type == "bearer"
         assert session.auth_config.credentials == {"token": "test-token"}
 
+    def test_upsert_session_from_dict(self, session_store, auth_session_data):
+        """Test creating a session from already parsed data."""
+        session = session_store.upsert_session("test", auth_session_data)
+        assert session.base_url == "https://api.example.com"
+        assert session.auth_config.credentials == {"token": "test-token"}
+
     def test_upsert_existing_session(self, session_store, basic_session_data, auth_session_data):
         """Test updating an existing session."""
         # Create initial session
@@ -69,6 +76,23 @@ class TestSessionStore:
         assert session.auth_config is not None
         assert session.auth_config.credentials == {"token": "test-token"}
 
+    def test_upsert_rejects_invalid_auth(self, temp_session_file, session_store, auth_session_data):
+        """Test that sessions with invalid auth settings are never saved."""
+        session_store.upsert_session("test", auth_session_data)
+        
+        with pytest.raises(ValueError, match="requires 'token'"):
+            session_store.upsert_session("bad", {
+                "base_url": "https://api.example.com",
+                "auth": {"type": "bearer", "credentials": {}}
+            })
+        auth_session_data["auth"]["type"] = "basic"
+        with pytest.raises(ValueError, match="requires"):
+            session_store.upsert_session("test", auth_session_data, overwrite=True)
+        
+        assert session_store.get_session("test").auth_config.type == "bearer"
+        assert "bad" not in session_store.list_sessions()
+        assert set(SessionStore(sessions_file=temp_session_file).list_sessions()) == {"test"}
+
     def test_get_session(self, session_store, basic_session_data):
         """Test getting a session."""
         # Create a session
@@ -123,6 +147,73 @@ class TestSessionStore:
         with pytest.raises(ValueError, match="Session 'nonexistent' not found"):
             session_store.delete_session("nonexistent")
 
+    def test_rename_session(self, session_store, auth_session_data):
+        """Test renaming a session keeps its configuration."""
+        original = session_store.upsert_session("test", json.dumps(auth_session_data))
+        session_store.upsert_session("other", json.dumps(auth_session_data))
+        
+        renamed = session_store.rename_session("test", "renamed")
+        assert renamed is original
+        assert renamed.name == "renamed"
+        assert "test" not in session_store.sessions
+        assert session_store.get_session("renamed").auth_config.credentials == {"token": "test-token"}
+        
+        with pytest.raises(ValueError, match="Session 'other' already exists"):
+            session_store.rename_session("renamed", "other")
+        with pytest.raises(ValueError, match="Session 'missing' not found"):
+            session_store.rename_session("missing", "new")
+
+    def test_set_base_url(self, temp_session_file, session_store, basic_session_data):
+        """Test changing the base URL of a session."""
+        session_store.upsert_session("test", json.dumps(basic_session_data))
+        session_store.set_base_url("test", "https://new.example.com")
+        
+        # Verify the change is persisted
+        new_store = SessionStore(sessions_file=temp_session_file)
+        assert new_store.get_session("test").base_url == "https://new.example.com"
+
+    def test_available_swagger_specs(self, session_store, tmp_path, basic_session_data):
+        """Test that only sessions with existing spec files are reported."""
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text("{}")
+        session_store.upsert_session("with-spec", {**basic_session_data, "swagger_spec_path": str(spec_file)})
+        session_store.upsert_session("missing-spec", {**basic_session_data, "swagger_spec_path": str(tmp_path / "gone.json")})
+        session_store.upsert_session("no-spec", basic_session_data)
+        
+        assert session_store.available_swagger_specs() == {str(spec_file)}
+
+    def test_batch_defers_writes(self, temp_session_file, session_store, basic_session_data):
+        """Test that mutations inside a batch are written once on exit."""
+        with session_store.batch():
+            session_store.upsert_session("first", basic_session_data)
+            with session_store.batch():
+                session_store.upsert_session("second", basic_session_data)
+            assert not os.path.exists(temp_session_file)
+            
+        new_store = SessionStore(sessions_file=temp_session_file)
+        assert set(new_store.sessions) == {"first", "second"}
+
+    def test_save_reencodes_only_changed_sessions(self, temp_session_file, session_store, basic_session_data, monkeypatch):
+        """Test that unchanged sessions reuse their encoded JSON on save."""
+        session_store.upsert_session("first", basic_session_data)
+        session_store.upsert_session("second", basic_session_data)
+        
+        encoded = []
+        original = serialization.dumps_bytes
+        def tracking_dumps(obj, indent=False):
+            encoded.append(obj)
+            return original(obj, indent)
+        monkeypatch.setattr(serialization, "dumps_bytes", tracking_dumps)
+        session_store.set_base_url("second", "https://new.example.com")
+        
+        assert session_store.get_session("second").to_dict() in encoded
+        assert session_store.get_session("first").to_dict() not in encoded
+        with open(temp_session_file) as f:
+            assert json.load(f) == {
+                "first": basic_session_data,
+                "second": {**basic_session_data, "base_url": "https://new.example.com"}
+            }
+
     def test_persistence(self, temp_session_file, basic_session_data):
         """Test that sessions persist to disk."""
         # Create a store and add a session
@@ -134,6 +225,21 @@ class TestSessionStore:
         assert "test" in store2.sessions
         assert store2.sessions["test"].base_url == "https://api.example.com"
 
+    def test_save_replaces_file_atomically(self, tmp_path, temp_session_file, session_store, basic_session_data, monkeypatch):
+        """Test that saves swap in a complete file and clean up on failure."""
+        session_store.upsert_session("test", basic_session_data)
+        assert os.listdir(tmp_path) == ["sessions.json"]
+        
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+        monkeypatch.setattr(os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            session_store.upsert_session("other", basic_session_data)
+            
+        # The previous file is intact and no temp file is left behind
+        assert os.listdir(tmp_path) == ["sessions.json"]
+        assert set(SessionStore(sessions_file=temp_session_file).sessions) == {"test"}
+
     def test_corrupted_file(self, temp_session_file):
         """Test handling of corrupted session file."""
         # Write invalid JSON to the file
@@ -142,4 +248,25 @@ class TestSessionStore:
         
         # Should start with empty sessions when file is corrupted
         store = SessionStore(sessions_file=temp_session_file)
-        assert store.sessions == {} 
\ No newline at end of file
+        assert store.sessions == {}
+
+    def test_corrupted_file_kept_aside(self, temp_session_file, basic_session_data):
+        """Test that saving after a corrupt load does not erase the corrupt file."""
+        with open(temp_session_file, 'w') as f:
+            f.write("invalid json")
+            
+        store = SessionStore(sessions_file=temp_session_file)
+        store.upsert_session("new", basic_session_data)
+        
+        with open(f"{temp_session_file}.corrupt") as f:
+            assert f.read() == "invalid json"
+        assert set(SessionStore(sessions_file=temp_session_file).sessions) == {"new"}
+
+    def test_get_default_session_store_is_shared(self, tmp_path, monkeypatch):
+        """Test that the default session store is created once per process."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        get_default_session_store.cache_clear()
+        try:
+            assert get_default_session_store() is get_default_session_store()
+        finally:
+            get_default_session_store.cache_clear()